@@ -1,4 +1,3 @@
-import re
 from pathlib import Path
 
 import streamlit as st
@@ -8,11 +7,12 @@ from sqlalchemy.orm import Session
 # from st_copy_to_clipboard import st_copy_to_clipboard
 from structlog import get_logger
 
-from apps.wizard.app_pages.chart_diff.chart_diff import get_chart_diffs_from_grapher
+from apps.wizard.app_pages.chart_diff.chart_diff import SLUG_SPLIT_REGEX, ChartDiff, get_chart_diffs_from_grapher
 from apps.wizard.app_pages.chart_diff.chart_diff_show import st_show
 from apps.wizard.app_pages.chart_diff.utils import WARN_MSG, get_engines
 from apps.wizard.utils import Pagination, set_states
 from etl import config
+from etl import grapher_model as gm
 from etl.config import OWID_ENV
 
 log = get_logger()
@@ -40,6 +40,8 @@ SOURCE_ENGINE, TARGET_ENGINE = get_engines()
 # SESSION STATE
 ########################################
 st.session_state.chart_diffs = st.session_state.get("chart_diffs", {})
+# Whether chart_diffs is sorted (set to False whenever chart_diffs is modified)
+st.session_state.chart_diffs_sorted = st.session_state.get("chart_diffs_sorted", False)
 st.session_state.arrange_charts_vertically = st.session_state.get("arrange_charts_vertically", False)
 st.session_state.conflicts_resolved_text = st.session_state.get("conflicts_resolved_text", {})
 
@@ -47,16 +49,19 @@ st.session_state.conflicts_resolved_text = st.session_state.get("conflicts_resol
 # LOAD VARIABLES
 ########################################
 CHART_PER_PAGE = 10
-# WARN_MSG += ["This tool is being developed! Please report any issues you encounter in `#proj-new-data-workflow`"]
+# NOTE: WARN_MSG is built once when `utils` is imported, while this script runs on every rerun. Hence, we work on a
+# copy, to avoid appending the same warnings again and again.
+warn_msg = list(WARN_MSG)
+# warn_msg += ["This tool is being developed! Please report any issues you encounter in `#proj-new-data-workflow`"]
 
 if str(config.GRAPHER_USER_ID) != "1":
-    WARN_MSG.append(
+    warn_msg.append(
         "`GRAPHER_USER_ID` from your .env is not set to 1 (Admin user). Please modify your .env or use STAGING=1 flag to set it automatically. "
         "All changes on staging servers must be done with Admin user."
     )
 
-if WARN_MSG:
-    st.warning("- " + "\n\n- ".join(WARN_MSG))
+if warn_msg:
+    st.warning("- " + "\n\n- ".join(warn_msg))
 
 
 ########################################
@@ -70,11 +75,14 @@ def get_chart_diffs():
     if st.session_state.chart_diffs == {}:
         with st.spinner("Getting charts from database..."):
             st.session_state.chart_diffs = get_chart_diffs_from_grapher(SOURCE_ENGINE, TARGET_ENGINE)
+            st.session_state.chart_diffs_sorted = False
 
-    # Sort charts
-    st.session_state.chart_diffs = dict(
-        sorted(st.session_state.chart_diffs.items(), key=lambda item: item[1].latest_update, reverse=True)
-    )
+    # Sort charts (only if they changed since last sorting)
+    if not st.session_state.chart_diffs_sorted:
+        st.session_state.chart_diffs = dict(
+            sorted(st.session_state.chart_diffs.items(), key=lambda item: item[1].latest_update, reverse=True)
+        )
+        st.session_state.chart_diffs_sorted = True
 
     # Init, can be changed by the toggle
     st.session_state.chart_diffs_filtered = st.session_state.chart_diffs
@@ -86,60 +94,57 @@ def filter_chart_diffs():
     This is based on the query parameters.
     """
 
-    def _slugs_match(chart_slug_1, chart_slug_2):
-        pattern = r"[,\s\-]+"
-        chart_slug_1 = set(re.split(pattern, chart_slug_1.lower()))
-        chart_slug_2 = set(re.split(pattern, chart_slug_2.lower()))
-        if chart_slug_1.intersection(chart_slug_2):
-            return True
-        return False
+    # Read query params proxy only once
+    query_params = st.query_params
 
     # Show all charts regardless of query params
-    if "show_all" in st.query_params:
+    if "show_all" in query_params:
         st.session_state.chart_diffs_filtered = {k: v for k, v in st.session_state.chart_diffs_filtered.items()}
     else:
-        # Filter based on query params
-        if "chart_id" in st.query_params:
-            chart_ids = list(map(int, st.query_params.get_all("chart_id")))
-            st.session_state.chart_diffs_filtered = {
-                k: v for k, v in st.session_state.chart_diffs_filtered.items() if v.chart_id in chart_ids
-            }
-        if "chart_slug" in st.query_params:
-            chart_slug = st.query_params.get("chart_slug", "")
-
-            st.session_state.chart_diffs_filtered = {
-                k: v for k, v in st.session_state.chart_diffs_filtered.items() if _slugs_match(chart_slug, v.slug)
-            }
-        if "hide_reviewed" in st.query_params:
-            st.session_state.chart_diffs_filtered = {
-                k: v for k, v in st.session_state.chart_diffs_filtered.items() if not v.is_reviewed
-            }
-        if "modified_or_new" in st.query_params:
-            modified_or_new = st.query_params.get_all("modified_or_new")
-            st.session_state.chart_diffs_filtered = {
-                k: v
-                for k, v in st.session_state.chart_diffs_filtered.items()
-                if (v.is_modified and "modified" in modified_or_new) or (v.is_new and "new" in modified_or_new)
-            }
-        if "change_type" in st.query_params:
+        # Get filters from query params (None if filter is not applied)
+        chart_ids = None
+        if "chart_id" in query_params:
+            chart_ids = set(map(int, query_params.get_all("chart_id")))
+        slug_tokens = None
+        if "chart_slug" in query_params:
+            # Tokenize the searched slug only once
+            chart_slug = query_params.get("chart_slug", "")
+            slug_tokens = frozenset(SLUG_SPLIT_REGEX.split(chart_slug.lower()))
+        hide_reviewed = "hide_reviewed" in query_params
+        modified_or_new = None
+        if "modified_or_new" in query_params:
+            modified_or_new = query_params.get_all("modified_or_new")
+        if "change_type" in query_params:
             # keep chart diffs with at least one change type (could be data, metadata or config)
-            change_types = st.query_params.get_all("change_type")
+            change_types = set(query_params.get_all("change_type"))
         else:
             # filter to changed config by default
-            change_types = ["new", "config"]
-
+            change_types = {"new", "config"}
+
+        def _keep(diff) -> bool:
+            if (chart_ids is not None) and (diff.chart_id not in chart_ids):
+                return False
+            if (slug_tokens is not None) and slug_tokens.isdisjoint(diff.slug_tokens):
+                return False
+            if hide_reviewed and diff.is_reviewed:
+                return False
+            if (modified_or_new is not None) and not (
+                (diff.is_modified and "modified" in modified_or_new) or (diff.is_new and "new" in modified_or_new)
+            ):
+                return False
+            return (not change_types.isdisjoint(diff.change_types)) or diff.is_new
+
+        # Apply all filters in a single pass
         st.session_state.chart_diffs_filtered = {
-            k: v
-            for k, v in st.session_state.chart_diffs_filtered.items()
-            if set(v.change_types) & set(change_types) or v.is_new
+            k: v for k, v in st.session_state.chart_diffs_filtered.items() if _keep(v)
         }
 
     # Return boolean if there was any filter applied (except for hiding approved charts)
     if (
-        "chart_id" in st.query_params
-        or "chart_slug" in st.query_params
-        # or "modified_or_new" in st.query_params
-        or "change_type" in st.query_params
+        "chart_id" in query_params
+        or "chart_slug" in query_params
+        # or "modified_or_new" in query_params
+        or "change_type" in query_params
     ):
         return True
     return False
@@ -151,8 +156,9 @@ def set_chart_diffs_to_pending(engine: Engine) -> None:
     st.markdown("**Do you want to set all charts-diffs to pending?** this will loose all your progress on reviews.")
     if st.button("Yes", type="primary"):
         with Session(engine) as session:
-            for _, chart_diff in st.session_state.chart_diffs.items():
-                chart_diff.unreview(session)
+            ChartDiff.set_status_batch(
+                session, list(st.session_state.chart_diffs.values()), gm.ChartStatus.PENDING.value
+            )
         st.rerun()
 
 
@@ -275,7 +281,12 @@ def _show_options_misc():
     st.button(
         "🔄 Refresh all charts",
         key="refresh-btn-general",
-        on_click=lambda: set_states({"chart_diffs": get_chart_diffs_from_grapher(SOURCE_ENGINE, TARGET_ENGINE)}),
+        on_click=lambda: set_states(
+            {
+                "chart_diffs": get_chart_diffs_from_grapher(SOURCE_ENGINE, TARGET_ENGINE),
+                "chart_diffs_sorted": False,
+            }
+        ),
         help="Get the latest chart versions, both from the staging and production servers.",
     )
     st.divider()
@@ -312,7 +323,7 @@ def _show_summary_top(chart_diffs):
     # Review status
     num_charts_total = len(st.session_state.chart_diffs)
     num_charts_listed = len(chart_diffs)
-    num_charts_reviewed = len([chart for chart in chart_diffs if chart.is_reviewed])
+    num_charts_reviewed = sum(1 for chart in chart_diffs if chart.is_reviewed)
     text = f"ℹ️ {num_charts_reviewed}/{num_charts_total} charts reviewed."
     st.markdown(text)
 
@@ -346,7 +357,7 @@ def render_app():
                 # Render chart diffs
                 with Session(SOURCE_ENGINE) as source_session, Session(TARGET_ENGINE) as target_session:
                     show_chart_diffs(
-                        [chart for chart in st.session_state.chart_diffs_filtered.values()],
+                        list(st.session_state.chart_diffs_filtered.values()),
                         "pagination",
                         source_session,
                         target_session,
@@ -365,19 +376,23 @@ def show_chart_diffs(chart_diffs, pagination_key, source_session: Session, targe
         _show_summary_top(chart_diffs)
 
         # Pagination
+        charts_per_page = st.session_state["charts-per-page"]
         pagination = Pagination(
             chart_diffs,
-            items_per_page=st.session_state["charts-per-page"],
+            items_per_page=charts_per_page,
             pagination_key=pagination_key,
         )
         ## Show controls only if needed
-        if len(chart_diffs) > st.session_state["charts-per-page"]:
+        if len(chart_diffs) > charts_per_page:
             pagination.show_controls(mode="bar")
 
-    # Show charts
-    with Session(TARGET_ENGINE) as target_session:
-        for chart_diff in pagination.get_page_items():
-            st_show(chart_diff, source_session, target_session)
+    # Get approval history of all charts in the page at once
+    page_items = pagination.get_page_items()
+    approvals = gm.ChartDiffApprovals.get_all_batch(source_session, [chart_diff.chart_id for chart_diff in page_items])
+
+    # Show charts (reuse the sessions opened by the caller for all charts in the page)
+    for chart_diff in page_items:
+        st_show(chart_diff, source_session, target_session, approvals=approvals[chart_diff.chart_id])
 
 
 ########################################
@@ -1,4 +1,5 @@
 import datetime as dt
+import re
 from typing import Dict, List, Optional
 
 import pandas as pd
@@ -12,6 +13,8 @@ from etl import grapher_model as gm
 from etl.db import read_sql
 
 ADMIN_GRAPHER_USER_ID = 1
+# Split slugs (or search queries) into words
+SLUG_SPLIT_REGEX = re.compile(r"[,\s\-]+")
 log = get_logger()
 
 
@@ -60,6 +63,7 @@ class ChartDiff:
         self._in_conflict = None
         self._change_types = None
         self._approval_status: Optional[gm.CHART_DIFF_STATUS | str] = None
+        self._slug_tokens: Optional[frozenset[str]] = None
 
     def _clean_cache(self):
         self._in_conflict = None
@@ -142,6 +146,17 @@ class ChartDiff:
             assert self.source_chart.config["slug"] == self.target_chart.config["slug"], "Slug mismatch!"
         return self.source_chart.config.get("slug", "no-slug")
 
+    @property
+    def slug_tokens(self) -> frozenset[str]:
+        """Get words in the slug of the chart (lowercased).
+
+        Used to search chart diffs by slug. The slug doesn't change during the lifetime of the object, so this is
+        computed only once.
+        """
+        if self._slug_tokens is None:
+            self._slug_tokens = frozenset(SLUG_SPLIT_REGEX.split(self.slug.lower()))
+        return self._slug_tokens
+
     @property
     def in_conflict(self) -> bool:
         """Check if the chart in target is newer than the source."""
@@ -294,21 +309,48 @@ class ChartDiff:
         # Only perform action if status changes!
         if self.approval_status != status:
             # Update approval status (in database)
-            assert self.chart_id
-            if self.is_modified:
-                assert self.target_chart
-            approval = gm.ChartDiffApprovals(
-                chartId=self.chart_id,
-                sourceUpdatedAt=self.source_chart.updatedAt,
-                targetUpdatedAt=None if self.is_new else self.target_chart.updatedAt,  # type: ignore
-                status=status,  # type: ignore
-            )
+            approval = self._new_approval(status)
             session.add(approval)
             session.commit()
 
             # Add approval to object
             self.approval = approval
 
+    @classmethod
+    def set_status_batch(
+        cls, session: Session, chart_diffs: List["ChartDiff"], status: gm.CHART_DIFF_STATUS | str
+    ) -> None:
+        """Update the state of multiple chart diffs.
+
+        Same as `set_status`, but all approvals are committed to the database at once.
+        """
+        # Only perform action on chart diffs whose status changes!
+        approvals = {diff: diff._new_approval(status) for diff in chart_diffs if diff.approval_status != status}
+        if approvals:
+            # Update approval statuses (in database)
+            session.add_all(approvals.values())
+            session.commit()
+
+            # Add approvals to objects
+            # NOTE: Set the cached status directly, since approvals may be expired (and detached) once the session is
+            # closed, and reading their status would then fail.
+            for diff, approval in approvals.items():
+                diff.approval = approval
+                diff._clean_cache()
+                diff._approval_status = status
+
+    def _new_approval(self, status: gm.CHART_DIFF_STATUS | str) -> gm.ChartDiffApprovals:
+        """Create approval object for the chart diff with the given status."""
+        assert self.chart_id
+        if self.is_modified:
+            assert self.target_chart
+        return gm.ChartDiffApprovals(
+            chartId=self.chart_id,
+            sourceUpdatedAt=self.source_chart.updatedAt,
+            targetUpdatedAt=None if self.is_new else self.target_chart.updatedAt,  # type: ignore
+            status=status,  # type: ignore
+        )
+
     def set_conflict_to_resolved(self, session: Session) -> None:
         """Update the state of the chart diff."""
         # Only perform action if status changes!
@@ -437,11 +479,26 @@ class ChartDiffsLoader:
     def __init__(self, source_engine: Engine, target_engine: Engine):
         self.source_engine = source_engine
         self.target_engine = target_engine
-        self.df = self.load_df()
 
         # Cache
+        self._df: pd.DataFrame | None = None
         self._diffs: List[ChartDiff] | None = None
 
+    @property
+    def df(self) -> pd.DataFrame:
+        """Changes in charts between environments.
+
+        Loaded lazily, so that refreshing a handful of charts (see `get_diffs(sync=True, chart_ids=...)`) doesn't
+        first scan all modified charts.
+        """
+        if self._df is None:
+            self._df = self.load_df()
+        return self._df
+
+    @df.setter
+    def df(self, value: pd.DataFrame) -> None:
+        self._df = value
+
     def load_df(self, chart_ids: List[int] | None = None) -> pd.DataFrame:
         """Load changes in charts between environments from sessions."""
         with Session(self.source_engine) as source_session:
@@ -653,18 +710,20 @@ def _modified_chart_configs_by_admin(
     # NOTE: chart IDs and variable IDs in both environments do not necessarily correspond to the same charts or indicators! While there might be a chart with ID X in both environments that corresponds to different charts, it is rare that there is a chart with ID X using indicator with ID Y, that are different. However, this can't be ruled out. Therefore, aligning source_df and target_df by chartId and variableId can fail sometimes!
     source_df, target_df = source_df.align(target_df, join="left")
 
-    diff = source_df.copy()
-    diff["configEdited"] = source_df["chartChecksum"] != target_df["chartChecksum"]
-
-    # Add flag 'edited in staging'
-    diff["chartEditedInStaging"] = source_df["chartLastEditedAt"] >= TIMESTAMP_STAGING_CREATION
+    # Build only the flags we return (no need to copy the whole source dataframe)
+    diff = pd.DataFrame(
+        {
+            "configEdited": source_df["chartChecksum"] != target_df["chartChecksum"],
+            # Add flag 'edited in staging'
+            "chartEditedInStaging": source_df["chartLastEditedAt"] >= TIMESTAMP_STAGING_CREATION,
+        }
+    )
 
     assert (
         diff["chartEditedInStaging"].notna().all()
     ), "chartEditedInStaging has missing values! This might be due to `diff` and `eidted` dataframes not having the same number of rows."
 
-    # Remove charts with no changes
-    return diff[["configEdited", "chartEditedInStaging"]]
+    return diff
 
 
 def modified_charts_by_admin(
@@ -694,14 +753,15 @@ def modified_charts_by_admin(
     return df
 
 
-def get_chart_diffs_from_grapher(
-    source_engine: Engine, target_engine: Engine, max_workers: int = 10
-) -> dict[int, ChartDiff]:
+def get_chart_diffs_from_grapher(source_engine: Engine, target_engine: Engine) -> dict[int, ChartDiff]:
     """Get chart diffs from Grapher.
 
     This means, checking for chart changes in the database.
 
     Changes in charts can be due to: chart config changes, changes in indicator timeseries, in indicator metadata, etc.
+
+    Charts are loaded in bulk (one query per environment, see `ChartDiff.from_charts_df`), so there is no need to
+    parallelise the per-chart fetching.
     """
     chart_diffs = ChartDiffsLoader(
         source_engine,
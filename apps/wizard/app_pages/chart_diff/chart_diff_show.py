@@ -6,6 +6,7 @@ If you want to learn more about it, start from its `show` method.
 import difflib
 import json
 import os
+from functools import partial
 from typing import Any, Dict, List, Optional, cast
 
 import streamlit as st
@@ -53,6 +54,14 @@ DISPLAY_STATE_OPTIONS_BINARY = {
         "icon": "⏳",
     },
 }
+# Labels of the review statuses in the radio buttons (precomputed, used as `format_func`)
+RADIO_LABELS = {
+    status: f":{option['color']}-background[{option['label']}]" for status, option in DISPLAY_STATE_OPTIONS.items()
+}
+RADIO_LABELS_BINARY = {
+    status: f":{option['color']}-background[{option['label']}]"
+    for status, option in DISPLAY_STATE_OPTIONS_BINARY.items()
+}
 # Help message if there is a conflict between production and staging (i.e. someone edited chart in production while we did on staging)
 CONFLICT_HELP_MESSAGE = "The chart in production was modified after creating the staging server. Please resolve the conflict by integrating the latest changes from production into staging."
 
@@ -70,12 +79,15 @@ class ChartDiffShow:
         target_session: Session,
         expander: bool = True,
         show_link: bool = True,
+        approvals: Optional[List[gm.ChartDiffApprovals]] = None,
     ):
         self.diff = diff
         self.source_session = source_session
         self.target_session = target_session
         self.expander = expander
         self.show_link = show_link
+        # History of approvals (if None, it is retrieved from the database when needed)
+        self.approvals = approvals
 
         # OpenAI
         if "OPENAI_API_KEY" in os.environ:
@@ -134,6 +146,7 @@ class ChartDiffShow:
                 case gm.ChartStatus.PENDING.value:
                     st.toast(f"**Resetting** state for chart {self.diff.chart_id}.", icon=":material/restart_alt:")
         self.diff._clean_cache()
+        self.approvals = None
 
     def _push_status_binary(self, session: Optional[Session] = None) -> None:
         """Change state of the ChartDiff based on session state."""
@@ -150,6 +163,7 @@ class ChartDiffShow:
                 case gm.ChartStatus.PENDING.value:
                     st.toast(f"**Resetting** state for chart {self.diff.chart_id}.", icon=":material/restart_alt:")
         self.diff._clean_cache()
+        self.approvals = None
 
     def _refresh_chart_diff(self):
         """Get latest chart version from database."""
@@ -157,7 +171,9 @@ class ChartDiffShow:
             sync=True, chart_ids=[self.diff.chart_id]
         )[0]
         st.session_state.chart_diffs[self.diff.chart_id] = diff_new
+        st.session_state.chart_diffs_sorted = False
         self.diff = diff_new
+        self.approvals = None
 
     @property
     def _header_production_chart(self):
@@ -226,7 +242,7 @@ class ChartDiffShow:
                 help="Click to resolve the conflicts and update the chart config.",
                 key=f"resolve-conflicts-btn-{self.diff.chart_id}",
                 type="primary",
-                on_click=lambda r=resolver: _resolve_conflicts(r),
+                on_click=partial(_resolve_conflicts, resolver),
             )
         else:
             st.success(
@@ -249,7 +265,7 @@ class ChartDiffShow:
                     key=f"radio-{self.diff.chart_id}",
                     options=self.status_names_binary,
                     horizontal=True,
-                    format_func=lambda x: f":{DISPLAY_STATE_OPTIONS_BINARY[x]['color']}-background[{DISPLAY_STATE_OPTIONS_BINARY[x]['label']}]",
+                    format_func=RADIO_LABELS_BINARY.__getitem__,
                     index=self.status_names_binary.index(self.diff.approval_status),  # type: ignore
                     on_change=self._push_status_binary,
                     help="Note that the changes in the chart come from ETL changes (metadata/data) and therefore there is no way to reject them at this stage. If you are not happy with the changes, please look at the ETL steps involved. We present them to you here as a sanity check, and ask you to review them for correctness.",
@@ -264,7 +280,7 @@ class ChartDiffShow:
                     key=f"radio-{self.diff.chart_id}",
                     options=self.status_names,
                     horizontal=True,
-                    format_func=lambda x: f":{DISPLAY_STATE_OPTIONS[x]['color']}-background[{DISPLAY_STATE_OPTIONS[x]['label']}]",
+                    format_func=RADIO_LABELS.__getitem__,
                     index=self.status_names.index(self.diff.approval_status),  # type: ignore
                     on_change=self._push_status,
                     disabled=self.diff.in_conflict,
@@ -430,9 +446,9 @@ class ChartDiffShow:
         # Two charts, actual diff
         else:
             # Detect arrangement type
-            arrange_vertical = st.session_state.get(
+            arrange_vertical = st.session_state.get("arrange-charts-vertically", False) or st.session_state.get(
                 f"arrange-charts-vertically-{self.diff.chart_id}", False
-            ) | st.session_state.get("arrange-charts-vertically", False)
+            )
 
             # Show charts
             if arrange_vertical:
@@ -459,13 +475,14 @@ class ChartDiffShow:
 
     def _show_approval_history(self):
         """Show history of approvals of a chart-diff."""
-        approvals = self.diff.get_all_approvals(self.source_session)
+        if self.approvals is None:
+            self.approvals = self.diff.get_all_approvals(self.source_session)
+        approvals = self.approvals
         # Get text
         text = ""
         for counter, approval in enumerate(approvals):
-            emoji = DISPLAY_STATE_OPTIONS[str(approval.status)]["icon"]
-            color = DISPLAY_STATE_OPTIONS[str(approval.status)]["color"]
-            text_ = f"{approval.updatedAt}: {emoji} :{color}[{approval.status}]"
+            options = DISPLAY_STATE_OPTIONS[str(approval.status)]
+            text_ = f"{approval.updatedAt}: {options['icon']} :{options['color']}[{approval.status}]"
 
             if counter == 0:
                 text_ = f"**{text_}**"
@@ -533,6 +550,10 @@ def compare_dictionaries(dix_1: Dict[str, Any], dix_2: Dict[str, Any]):
 
     Useful for chart config diffs, indicator metadata diffs, etc.
     """
+    # Nothing to serialize and diff if both dictionaries are equal
+    if dix_1 == dix_2:
+        return ""
+
     d1 = json.dumps(dix_1, indent=4)
     d2 = json.dumps(dix_2, indent=4)
 
@@ -568,6 +589,7 @@ def st_show(
     target_session: Session,
     expander: bool = True,
     show_link: bool = True,
+    approvals: Optional[List[gm.ChartDiffApprovals]] = None,
 ) -> None:
     """Show the chart diff in Streamlit."""
     handle = ChartDiffShow(
@@ -576,5 +598,6 @@ def st_show(
         target_session=target_session,
         expander=expander,
         show_link=show_link,
+        approvals=approvals,
     )
     handle.show()
@@ -20,6 +20,15 @@ ENVIRONMENT_IDS = {
     1: "PRODUCTION",
     2: "STAGING",
 }
+# Chart config fields that are not compared when looking for conflicts
+KEYS_IGNORE = frozenset(
+    {
+        "bakedGrapherURL",
+        "adminBaseUrl",
+        "dataApiUrl",
+        # "version",
+    }
+)
 
 
 class ChartDiffConflictResolver:
@@ -108,7 +117,7 @@ class ChartDiffConflictResolver:
             "Choose config from...",
             options=[1, 2],
             captions=["Insert production config", "Insert staging config"],
-            format_func=lambda x: ENVIRONMENT_IDS[x],
+            format_func=ENVIRONMENT_IDS.__getitem__,
             key=f"conflict-radio-{field['key']}-{self.diff.chart_id}",
             horizontal=True,
             label_visibility="collapsed",
@@ -180,19 +189,13 @@ class ChartDiffConflictResolver:
 
 def compare_chart_configs(c1, c2):
     """Compare to chart configs c1 and c2."""
-    keys = set(c1.keys()).union(c2.keys())
+    # Fast path: identical configs (common after a refresh). Dictionary equality is evaluated in C and exits early.
+    if c1 == c2:
+        return []
+
     diff_list = []
-    KEYS_IGNORE = {
-        "bakedGrapherURL",
-        "adminBaseUrl",
-        "dataApiUrl",
-        # "version",
-    }
-    for key in keys:
-        if key in KEYS_IGNORE:
-            continue
-        value1 = c1.get(key)
-        value2 = c2.get(key)
+
+    def _add_diff(key, value1, value2):
         if value1 != value2:
             if isinstance(value1, dict):
                 value1 = json.dumps(value1, indent=4)
@@ -206,6 +209,14 @@ def compare_chart_configs(c1, c2):
                 }
             )
 
+    # Keys in c1 (missing keys in c2 are compared as None)
+    for key, value1 in c1.items():
+        if key not in KEYS_IGNORE:
+            _add_diff(key, value1, c2.get(key))
+    # Keys only in c2
+    for key in c2.keys() - c1.keys() - KEYS_IGNORE:
+        _add_diff(key, None, c2[key])
+
     return diff_list
 
 
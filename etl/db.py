@@ -50,6 +50,9 @@ def _get_engine_cached(cf: Any, pid: int) -> Engine:
         f"mysql+pymysql://{cf.DB_USER}:{quote(cf.DB_PASS)}@{cf.DB_HOST}:{cf.DB_PORT}/{cf.DB_NAME}",
         pool_size=30,  # Increase the pool size to allow higher GRAPHER_WORKERS
         max_overflow=30,  # Increase the max overflow limit to allow higher GRAPHER_WORKERS
+        # Recycle connections before MySQL closes them for being idle (wait_timeout), so that long-lived processes
+        # (e.g. Wizard) don't need to ping the server before reusing a pooled connection
+        pool_recycle=3600,
     )
 
 
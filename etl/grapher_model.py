@@ -1424,6 +1424,24 @@ class ChartDiffApprovals(Base):
         ).fetchall()
         return list(result)
 
+    @classmethod
+    def get_all_batch(cls, session: Session, chart_ids: List[int]) -> Dict[int, List["ChartDiffApprovals"]]:
+        """Get history of values of multiple charts.
+
+        Returns: Dictionary mapping each chart_id to its history (sorted from latest to oldest).
+        """
+        result = session.scalars(
+            select(cls)
+            .where(
+                cls.chartId.in_(chart_ids),
+            )
+            .order_by(cls.updatedAt.desc())
+        ).fetchall()
+        history = {chart_id: [] for chart_id in chart_ids}
+        for approval in result:
+            history[approval.chartId].append(approval)
+        return history
+
 
 class ChartDiffConflicts(Base):
     __tablename__ = "chart_diff_conflicts"
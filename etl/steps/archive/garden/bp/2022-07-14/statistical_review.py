@@ -238,26 +238,12 @@ def fill_missing_values_with_previous_version(table: catalog.Table, table_old: c
     #   may be added (e.g. Kenya and Ethiopia were present in the 2021 release because they had data for
     #   geothermal_capacity, but they are not included in the 2022 release, since they don't have data for any other
     #   variable). This could lead to unharmonized country names appearing in the current dataset.
-    # Combine the current output table with the table from the previous version the dataset.
-    combined = pd.merge(
-        table,
-        table_old[[column for column in table_old.columns if column in table.columns]],
-        left_index=True,
-        right_index=True,
-        how="left",
-        suffixes=("", "_old"),
-    )
-
-    # List the common columns that can be filled with values from the previous version.
-    columns = [column for column in combined.columns if column.endswith("_old")]
-
-    # Fill missing values in the current table with values from the old table.
-    for column_old in columns:
-        column = column_old.replace("_old", "")
-        combined[column] = combined[column].fillna(combined[column_old])
+    # Align the old table with the rows of the current table.
+    table_old = table_old[[column for column in table_old.columns if column in table.columns]].reindex(table.index)
 
-    # Remove columns from the old table.
-    combined = combined.drop(columns=columns)
+    # Fill missing values in the current table with values from the old table (keeping the original column order).
+    # NOTE: combine_first turns categorical columns (e.g. country_code) into object, so the original dtypes are restored.
+    combined = table.combine_first(table_old)[table.columns].astype(table.dtypes.to_dict())
 
     # Transfer metadata from the table of the current dataset into the combined table.
     combined.metadata = deepcopy(table.metadata)
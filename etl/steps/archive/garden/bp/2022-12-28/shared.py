@@ -150,6 +150,7 @@ def load_population() -> pd.DataFrame:
     # Add data for historical regions (if not in population) by adding the population of its current successors.
     countries_with_population = population["country"].unique()
     missing_countries = [country for country in HISTORIC_TO_CURRENT_REGION if country not in countries_with_population]
+    populations_missing = []
     for country in missing_countries:
         members = HISTORIC_TO_CURRENT_REGION[country]["members"]
         _population = (
@@ -161,7 +162,9 @@ def load_population() -> pd.DataFrame:
         # Select only years for which we have data for all member countries.
         _population = _population[_population["country"] == len(members)].reset_index(drop=True)
         _population["country"] = country
-        population = pd.concat([population, _population], ignore_index=True).reset_index(drop=True)
+        populations_missing.append(_population)
+    # Concatenate all historical regions at once (instead of once per region).
+    population = pd.concat([population] + populations_missing, ignore_index=True)
 
     error = "Duplicate country-years found in population. Check if historical regions changed."
     assert population[population.duplicated(subset=["country", "year"])].empty, error
@@ -181,17 +184,18 @@ def load_income_groups() -> pd.DataFrame:
     # Load the WorldBank dataset for income grups.
     income_groups = catalog.Dataset(DATA_DIR / "garden/wb/2021-07-01/wb_income")["wb_income_group"].reset_index()
 
-    # Add historical regions to income groups.
-    for historic_region in HISTORIC_TO_CURRENT_REGION:
-        historic_region_income_group = HISTORIC_TO_CURRENT_REGION[historic_region]["income_group"]
-        if historic_region not in income_groups["country"]:
-            historic_region_df = pd.DataFrame(
-                {
-                    "country": [historic_region],
-                    "income_group": [historic_region_income_group],
-                }
-            )
-            income_groups = pd.concat([income_groups, historic_region_df], ignore_index=True)
+    # Add historical regions to income groups (if not already included).
+    # NOTE: Membership must be checked on the values of the country column (not on the index of the series).
+    countries_with_income_group = set(income_groups["country"])
+    historic_regions = [region for region in HISTORIC_TO_CURRENT_REGION if region not in countries_with_income_group]
+    if historic_regions:
+        historic_regions_df = pd.DataFrame(
+            {
+                "country": historic_regions,
+                "income_group": [HISTORIC_TO_CURRENT_REGION[region]["income_group"] for region in historic_regions],
+            }
+        )
+        income_groups = pd.concat([income_groups, historic_regions_df], ignore_index=True)
 
     return cast(pd.DataFrame, income_groups)
 
@@ -289,67 +293,52 @@ def detect_overlapping_data_for_regions_and_members(
 
     """
     if known_overlaps is not None:
-        df = df.copy()
-
+        # Omit the field "entity_to_make_nan" when checking if an overlap is known.
+        _known_overlaps = [
+            {key: value for key, value in overlap.items() if key != "entity_to_make_nan"} for overlap in known_overlaps
+        ]
+
+        # Create a boolean dataframe that is True for each country, year and variable with data.
+        # Optionally, consider zeros as missing data.
+        variables = [column for column in df.columns if column not in index_columns]
+        informed = df[variables].notna()
         if ignore_zeros:
-            # Replace zeros by nans, so that zeros are ignored when looking for overlapping data.
-            overlapping_values_to_ignore = [0]
-        else:
-            overlapping_values_to_ignore = []
-
-        regions = list(regions_and_members)
-        for region in regions:
-            # Create a dataframe with only data for the region, and remove columns that only have nans.
-            # Optionally, replace zeros by nans, to also remove columns that only have zeros or nans.
-            region_df = (
-                df[df["country"] == region].replace(overlapping_values_to_ignore, np.nan).dropna(axis=1, how="all")
-            )
+            informed &= df[variables] != 0
+        informed = informed.groupby([df["country"], df["year"]]).any()
+        countries = set(informed.index.get_level_values("country"))
+
+        for region in regions_and_members:
+            if region not in countries:
+                continue
+            region_informed = informed.loc[region]
+            # Years where the region has data for any variable.
+            region_years = set(region_informed.index[region_informed.any(axis=1)])
             members = regions_and_members[region]["members"]
             for member in members:
-                # Create a dataframe for this particular member country.
-                member_df = (
-                    df[df["country"] == member].replace(overlapping_values_to_ignore, np.nan).dropna(axis=1, how="all")
-                )
-                # Find common columns with (non-nan) data between region and member country.
-                variables = [
-                    column
-                    for column in (set(region_df.columns) & set(member_df.columns))
-                    if column not in index_columns
-                ]
-                for variable in variables:
-                    # Concatenate region and member country's data for this variable.
-                    combined = (
-                        pd.concat(
-                            [
-                                region_df[["year", variable]],
-                                member_df[["year", variable]],
-                            ],
-                            ignore_index=True,
+                if member not in countries:
+                    continue
+                member_informed = informed.loc[member]
+                # Skip members that have no data on any of the years where the region has data (the most common case).
+                if region_years.isdisjoint(member_informed.index[member_informed.any(axis=1)]):
+                    continue
+                # Find years and variables where both region and member country have data.
+                region_aligned, member_aligned = region_informed.align(member_informed, join="inner")
+                overlapping = region_aligned & member_aligned
+                for variable in overlapping.columns[overlapping.any()]:
+                    overlapping_years = overlapping.index[overlapping[variable]].tolist()
+                    new_overlap = {
+                        "region": region,
+                        "member": member,
+                        "years": overlapping_years,
+                        "variable": variable,
+                    }
+                    # Check if the overlap found is already in the list of known overlaps.
+                    # If this overlap is not known, raise a warning.
+                    if new_overlap not in _known_overlaps:
+                        log.warning(
+                            f"Data for '{region}' overlaps with '{member}' on '{variable}' "
+                            f"and years: {overlapping_years}"
                         )
-                        .dropna()
-                        .reset_index(drop=True)
-                    )
-                    # Find years where region and member country overlap.
-                    overlapping = combined[combined.duplicated(subset="year")]
-                    if not overlapping.empty:
-                        overlapping_years = sorted(set(overlapping["year"]))
-                        new_overlap = {
-                            "region": region,
-                            "member": member,
-                            "years": overlapping_years,
-                            "variable": variable,
-                        }
-                        # Check if the overlap found is already in the list of known overlaps.
-                        # If this overlap is not known, raise a warning.
-                        # Omit the field "entity_to_make_nan" when checking if this overlap is known.
-                        _known_overlaps = [
-                            {key for key in overlap if key != "entity_to_make_nan"} for overlap in known_overlaps
-                        ]
-                        if new_overlap not in _known_overlaps:  # type: ignore
-                            log.warning(
-                                f"Data for '{region}' overlaps with '{member}' on '{variable}' "
-                                f"and years: {overlapping_years}"
-                            )
 
 
 def remove_overlapping_data_for_regions_and_members(
@@ -383,31 +372,26 @@ def remove_overlapping_data_for_regions_and_members(
     """
     if known_overlaps is not None:
         df = df.copy()
-
-        if ignore_zeros:
-            overlapping_values_to_ignore = [0]
-        else:
-            overlapping_values_to_ignore = []
+        countries = set(df[country_col])
 
         for i, overlap in enumerate(known_overlaps):
-            if set([overlap["region"], overlap["member"]]) <= set(df["country"]):
+            if set([overlap["region"], overlap["member"]]) <= countries:
+                # Select rows with data for the variable (optionally, considering zeros as missing data).
+                values = df[overlap["variable"]]
+                informed = values.notna()
+                if ignore_zeros:
+                    informed &= values != 0
                 # Check that the known overlap is indeed found in the data.
-                duplicated_rows = (
-                    df[(df[country_col].isin([overlap["region"], overlap["member"]]))][
-                        [country_col, year_col, overlap["variable"]]
-                    ]
-                    .replace(overlapping_values_to_ignore, np.nan)
-                    .dropna(subset=overlap["variable"])
-                )
-                duplicated_rows = duplicated_rows[duplicated_rows.duplicated(subset="year", keep=False)]
-                overlapping_years = sorted(set(duplicated_rows["year"]))
+                region_years = set(df[year_col][informed & (df[country_col] == overlap["region"])])
+                member_years = set(df[year_col][informed & (df[country_col] == overlap["member"])])
+                overlapping_years = sorted(region_years & member_years)
                 if overlapping_years != overlap["years"]:
                     log.warning(f"Given overlap number {i} is not found in the data; redefine this list.")
                 # Make nan data points for either the region or the member (which is specified by "entity to make nan").
-                indexes_to_make_nan = duplicated_rows[
-                    duplicated_rows["country"] == overlap[overlap["entity_to_make_nan"]]  # type: ignore
-                ].index.tolist()
-                df.loc[indexes_to_make_nan, overlap["variable"]] = np.nan
+                entity_to_make_nan = overlap[overlap["entity_to_make_nan"]]  # type: ignore
+                df.loc[
+                    (df[country_col] == entity_to_make_nan) & df[year_col].isin(overlapping_years), overlap["variable"]
+                ] = np.nan
 
     return df
 
@@ -480,13 +464,14 @@ def add_region_aggregates(
         Data after adding aggregate regions.
 
     """
-    data = data.copy()
-
     if aggregates is None:
         # If aggregations are not specified, assume all variables are to be aggregated, by summing.
         aggregates = {column: "sum" for column in data.columns if column not in index_columns}
+    variables = list(aggregates)
+
     # Get the list of regions to create, and their member countries.
     countries_in_regions = load_countries_in_regions()
+    data_members = []
     for region in regions:
         # List of countries in region.
         countries_in_region = countries_in_regions[region]
@@ -505,25 +490,19 @@ def add_region_aggregates(
             known_overlaps=known_overlaps,
         )
 
-        # Add region aggregates.
-        data_region = geo.add_region_aggregates(
-            df=data_region,
-            region=region,
-            country_col=country_column,
-            year_col=year_column,
-            aggregations=aggregates,
-            countries_in_region=countries_in_region,
-            countries_that_must_have_data=[],
-            # Here we allow aggregating even when there are few countries informed (which seems to agree with BP's
-            # criterion for aggregates).
-            # However, if absolutely all countries have nan, we want the aggregate to be nan, not zero.
-            frac_allowed_nans_per_year=0.999,
-            num_allowed_nans_per_year=None,
-        )
-        data = pd.concat(
-            [data, data_region[data_region[country_column] == region]],
-            ignore_index=True,
-        ).reset_index(drop=True)
+        data_members.append(data_region[[country_column, year_column] + variables].assign(region=region))
+
+    # Aggregate all regions at once (instead of concatenating the full data after aggregating each region).
+    grouped = pd.concat(data_members, ignore_index=True).groupby(["region", year_column], sort=False)
+    # Here we allow aggregating even when there are few countries informed (which seems to agree with BP's criterion
+    # for aggregates).
+    # However, if absolutely all countries have nan, we want the aggregate to be nan, not zero.
+    data_regions = grouped.agg(aggregates).where(grouped[variables].count() > 0)
+    data_regions = data_regions.reset_index().rename(columns={"region": country_column})
+
+    # NOTE: The concatenation creates a new dataframe, so the input data is not modified below (and there is no need
+    # to copy it beforehand).
+    data = pd.concat([data, data_regions], ignore_index=True)
 
     if region_codes is not None:
         # Add region codes to regions.
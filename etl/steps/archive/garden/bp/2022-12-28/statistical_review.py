@@ -10,8 +10,6 @@ these regions mean a different set of countries for different variables.
 
 """
 
-from copy import deepcopy
-
 import numpy as np
 import pandas as pd
 from owid import catalog
@@ -161,6 +159,8 @@ AGGREGATES_BY_SUM = [
     # 'Solar Consumption - TWh (zero filled)',
     # 'Wind Consumption - TWh (zero filled)',
 ]
+# Aggregation to apply to each variable when constructing region aggregates.
+AGGREGATIONS = {column: "sum" for column in AGGREGATES_BY_SUM}
 
 
 def prepare_output_table(df: pd.DataFrame, bp_table: catalog.Table) -> catalog.Table:
@@ -180,33 +180,32 @@ def prepare_output_table(df: pd.DataFrame, bp_table: catalog.Table) -> catalog.T
         Table, ready to be added to a new garden dataset.
 
     """
-    # Create new table.
-    table = catalog.Table(df).copy()
-
-    # Replace spurious inf values by nan.
-    table = table.replace([np.inf, -np.inf], np.nan)
+    # Replace spurious inf values by nan (this creates a new dataframe, so the rest can be done in place).
+    df = df.replace([np.inf, -np.inf], np.nan)
 
     # Sort conveniently and add an index.
-    table = (
-        table.sort_values(["country", "year"])
-        .reset_index(drop=True)
-        .set_index(["country", "year"], verify_integrity=True)
-        .astype({"country_code": "category"})
-    )
+    # NOTE: This is done on the dataframe (before creating the table) to avoid the overhead of propagating variable
+    # metadata on each operation (metadata is anyway taken from the original table below).
+    df.sort_values(["country", "year"], ignore_index=True, inplace=True)
+    df.set_index(["country", "year"], verify_integrity=True, inplace=True)
+    df["country_code"] = df["country_code"].astype("category")
+
+    # Create new table.
+    table = catalog.Table(df)
 
     # Convert column names to lower, snake case.
     table = catalog.utils.underscore_table(table)
 
     # Get the table metadata from the original table.
-    table.metadata = deepcopy(bp_table.metadata)
+    table.metadata = bp_table.metadata.copy()
 
     # Update table metadata.
     table.metadata.title = "Statistical Review of World Energy"
     table.metadata.short_name = "statistical_review"
 
     # Get the metadata of each variable from the original table.
-    for column in table.drop(columns="country_code").columns:
-        table[column].metadata = deepcopy(bp_table[column].metadata)
+    for column in table.columns.drop("country_code"):
+        table[column].metadata = bp_table[column].metadata.copy()
 
     return table
 
@@ -245,37 +244,23 @@ def fill_missing_values_with_previous_version(table: catalog.Table, table_old: c
     #   may be added (e.g. Kenya and Ethiopia were present in the 2021 release because they had data for
     #   geothermal_capacity, but they are not included in the 2022 release, since they don't have data for any other
     #   variable). This could lead to unharmonized country names appearing in the current dataset.
-    # Combine the current output table with the table from the previous version the dataset.
-    combined = pd.merge(
-        table,
-        table_old[[column for column in table_old.columns if column in table.columns]],
-        left_index=True,
-        right_index=True,
-        how="left",
-        suffixes=("", "_old"),
-    )
-
-    # List the common columns that can be filled with values from the previous version.
-    columns = [column for column in combined.columns if column.endswith("_old")]
-
-    # Fill missing values in the current table with values from the old table.
-    for column_old in columns:
-        column = column_old.replace("_old", "")
-        combined[column] = combined[column].fillna(combined[column_old])
+    # Align the old table with the rows of the current table.
+    table_old = table_old[[column for column in table_old.columns if column in table.columns]].reindex(table.index)
 
-    # Remove columns from the old table.
-    combined = combined.drop(columns=columns)
+    # Fill missing values in the current table with values from the old table (keeping the original column order).
+    # NOTE: combine_first turns categorical columns (e.g. country_code) into object, so the original dtypes are restored.
+    combined = table.combine_first(table_old)[table.columns].astype(table.dtypes.to_dict())
 
     # Transfer metadata from the table of the current dataset into the combined table.
-    combined.metadata = deepcopy(table.metadata)
+    combined.metadata = table.metadata.copy()
     # When that is not possible (for columns that were only in the old but not in the new table),
     # get the metadata from the old table.
 
     for column in combined.columns:
         try:
-            combined[column].metadata = deepcopy(table[column].metadata)
+            combined[column].metadata = table[column].metadata.copy()
         except KeyError:
-            combined[column].metadata = deepcopy(table_old[column].metadata)
+            combined[column].metadata = table_old[column].metadata.copy()
 
     # Sanity checks.
     assert len(combined) == len(table)
@@ -304,7 +289,8 @@ def amend_zero_filled_variables_for_region_aggregates(df: pd.DataFrame) -> pd.Da
     zero_filled_variables = [column for column in df.columns if "(zero filled)" in column]
     original_variables = [column.replace(" (zero filled)", "") for column in df.columns if "(zero filled)" in column]
     select_regions = df["country"].isin(REGIONS_TO_ADD)
-    df.loc[select_regions, zero_filled_variables] = df[select_regions][original_variables].fillna(0).values
+    # Select region rows and original columns in one go (instead of first copying all columns of region rows).
+    df.loc[select_regions, zero_filled_variables] = df.loc[select_regions, original_variables].fillna(0).to_numpy()
 
     return df
 
@@ -341,7 +327,7 @@ def run(dest_dir: str) -> None:
         index_columns=["country", "year", "country_code"],
         country_column="country",
         year_column="year",
-        aggregates={column: "sum" for column in AGGREGATES_BY_SUM},
+        aggregates=AGGREGATIONS,
         known_overlaps=OVERLAPPING_DATA_TO_REMOVE_IN_AGGREGATES,  # type: ignore
         region_codes=[REGIONS_TO_ADD[region]["country_code"] for region in REGIONS_TO_ADD],
     )
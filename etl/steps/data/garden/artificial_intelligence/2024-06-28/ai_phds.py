@@ -18,7 +18,8 @@ def run(dest_dir: str) -> None:
     #
     # Process data.
     #
-    tb["value"] = tb["value"].str.replace("%", "")
+    # Remove percentage signs and get numeric values right away
+    tb["value"] = tb["value"].str.replace("%", "", regex=False).astype("float64")
     tb = tb.pivot(index=["Year"], columns="indicator", values="value").reset_index()
     tb["country"] = "United States and Canada"
     tb = tb.format(["country", "year"])
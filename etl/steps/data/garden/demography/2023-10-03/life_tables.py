@@ -18,7 +18,8 @@ from typing import List, cast
 
 import numpy as np
 import owid.catalog.processing as pr
-from owid.catalog import Table
+import pandas as pd
+from owid.catalog import Table, Variable
 
 from etl.helpers import PathFinder, create_dataset
 
@@ -59,14 +60,16 @@ def run(dest_dir: str) -> None:
     ds_un = paths.load_dataset("un_wpp_lt")
 
     # Read table from meadow dataset.
-    tb_hmd = ds_hmd["hmd"].reset_index()
-    tb_un = ds_un["un_wpp_lt"].reset_index()
+    ## NOTE: read_table does not set the index of the tables, which avoids building (and then resetting) the
+    ## multi-indexes of these large tables.
+    tb_hmd = ds_hmd.read_table("hmd")
+    tb_un = ds_un.read_table("un_wpp_lt")
 
     #
     # Process data.
     #
-    # Set type='period' for UN data
-    tb_un["type"] = "period"
+    # Set type='period' for UN data (as a categorical, to avoid creating one string object per row)
+    tb_un["type"] = pd.Categorical.from_codes(np.zeros(len(tb_un), dtype=np.int8), categories=["period"])
 
     # Add life expectancy differences and ratios
     paths.log.info("calculating extra variables (ratio and difference in life expectancy for f and m).")
@@ -77,11 +80,10 @@ def run(dest_dir: str) -> None:
     tb = combine_tables(tb_hmd, tb_un)
 
     # Set DTypes
-    tb = tb.astype(
-        {
-            "age": str,
-        }
-    )
+    ## Use categoricals for dimensions with few distinct values (so that building and verifying the index below works
+    ## on integer codes instead of strings)
+    ## NOTE: 'age' is already a categorical of strings (see combine_tables).
+    tb = tb.astype({column: "category" for column in ["type", "location", "sex"]})
 
     # Set index
     tb = tb.set_index(COLUMNS_INDEX, verify_integrity=True)
@@ -106,35 +108,56 @@ def combine_tables(tb_hmd: Table, tb_un: Table) -> Table:
         - We decided against this to ensure comparability across countries (i.e. all countries use same source after 1950).
     """
     # HMD
-    ## Get only format=1x1 in HMD, drop 'format' column
-    tb_hmd = tb_hmd[tb_hmd["format"] == "1x1"].drop(columns=["format"])
-    ## Ensure year is int
-    tb_hmd["year"] = tb_hmd["year"].astype(str).astype("Int64")
+    ## NOTE: Low-cardinality string columns are handled as categoricals (which is how they are stored in meadow, so
+    ## these conversions are usually no-ops), so that comparisons and parsing work on categories and integer codes.
+    format_ = tb_hmd["format"].astype("category")
+    type_ = tb_hmd["type"].astype("category")
+    year_ = tb_hmd["year"].astype("category")
+    ## Get only format=1x1 in HMD
+    is_1x1 = (format_ == "1x1").to_numpy()
+    ## Parse years (other formats have year ranges, e.g. '1950-1954', which are only relevant to build the mask below)
+    ## NOTE: Only the unique years (categories) are parsed.
+    year_codes = year_.cat.codes.to_numpy()
+    year = np.where(
+        year_codes >= 0, pd.to_numeric(year_.cat.categories, errors="coerce").to_numpy(dtype=float)[year_codes], np.nan
+    )
     ## Sanity check years
-    assert tb_hmd["year"].max() == 2022, "HMD data should end in 2022"
-    assert tb_hmd["year"].min() == 1676, "HMD data should start in 1676"
+    assert not np.isnan(year[is_1x1]).any(), "HMD data with format 1x1 should have integer years"
+    assert year[is_1x1].max() == 2022, "HMD data should end in 2022"
+    assert year[is_1x1].min() == 1676, "HMD data should start in 1676"
     ## Keep only period HMD data prior to 1950 (UN data starts in 1950)
-    tb_hmd = tb_hmd[((tb_hmd["year"] < 1950) & (tb_hmd["type"] == "period")) | (tb_hmd["type"] == "cohort")]
+    ## NOTE: All conditions are combined in a single mask, so that the table is filtered (and copied) only once.
+    mask = is_1x1 & (((year < 1950) & (type_ == "period").to_numpy()) | (type_ == "cohort").to_numpy())
+    ## Filter relevant columns (UN has two columns that HMD doesn't: 'probability_of_survival', 'survivorship_ratio')
+    ## NOTE: Columns are selected together with rows, so that irrelevant columns (e.g. 'format') are never copied.
+    columns_indicators_hmd = [col for col in tb_hmd.columns if col in COLUMNS_INDICATORS]
+    tb_hmd = tb_hmd.loc[mask, ["type", "country", "year", "sex", "age"] + columns_indicators_hmd]
+    ## Ensure year is int (reuse the already parsed years, instead of parsing them again from strings)
+    tb_hmd["year"] = pd.array(year[mask], dtype="Int64")
     ## Column renames
     tb_hmd = tb_hmd.rename(
         columns={
             "country": "location",
         }
     )
-    ## Filter relevant columns (UN has two columns that HMD doesn't: 'probability_of_survival', 'survivorship_ratio')
-    columns_indicators_hmd = [col for col in tb_hmd.columns if col in COLUMNS_INDICATORS]
-    tb_hmd = tb_hmd[COLUMNS_INDEX + columns_indicators_hmd]
 
     # UN
-    ## Sanity check years
-    assert tb_un["year"].max() == 2021, "UN data should end in 2021"
-    assert tb_un["year"].min() == 1950, "UN data should start in 1950"
-    assert (tb_un["year"].drop_duplicates().diff().dropna() == 1).all(), "UN data should be yearly"
+    ## Sanity check years (unique years are sorted, so the year column is only scanned once)
+    years_un = np.unique(tb_un["year"].to_numpy())
+    assert years_un[-1] == 2021, "UN data should end in 2021"
+    assert years_un[0] == 1950, "UN data should start in 1950"
+    assert (np.diff(years_un) == 1).all(), "UN data should be yearly"
     ## Filter relevant columns
     tb_un = tb_un[COLUMNS_INDEX + COLUMNS_INDICATORS]
 
+    # Ensure age is a categorical of strings in both tables (so that it remains categorical after concatenating them)
+    tb_hmd["age"] = age_as_categorical_of_strings(tb_hmd["age"])
+    tb_un["age"] = age_as_categorical_of_strings(tb_un["age"])
+
     # Combine tables
-    tb = pr.concat([tb_hmd, tb_un], short_name=paths.short_name)
+    ## NOTE: The row index is discarded (the table is indexed by COLUMNS_INDEX afterwards), so there is no need to
+    ## combine the indexes of both tables.
+    tb = pr.concat([tb_hmd, tb_un], ignore_index=True, short_name=paths.short_name)
 
     # Remove all-NaN rows
     tb = tb.dropna(subset=COLUMNS_INDICATORS, how="all")
@@ -142,6 +165,15 @@ def combine_tables(tb_hmd: Table, tb_un: Table) -> Table:
     return tb
 
 
+def age_as_categorical_of_strings(age: Variable) -> Variable:
+    """Convert age groups to a categorical of strings.
+
+    Only the categories (i.e. the unique age groups) are converted to strings, instead of all the values.
+    """
+    age = age.astype("category")
+    return age.cat.rename_categories(age.cat.categories.astype(str))
+
+
 def add_le_diff_and_ratios(tb: Table, columns_primary: List[str]) -> Table:
     """Add metrics on life expectancy ratios and differences between females and males."""
     ## Get relevant metric, split into f and m tables
@@ -588,7 +588,8 @@ def run(dest_dir: str) -> None:
     #
     # Load meadow dataset and read its tables.
     ds_meadow = paths.load_dataset("statistical_review_of_world_energy")
-    tb_meadow = ds_meadow["statistical_review_of_world_energy"].reset_index()
+    # NOTE: Only the columns that are used are read from the main table.
+    tb_meadow = ds_meadow.read_table("statistical_review_of_world_energy", columns=list(COLUMNS))
     tb_meadow_prices = ds_meadow["statistical_review_of_world_energy_prices"].reset_index()
     tb_efficiency = ds_meadow["statistical_review_of_world_energy_efficiency_factors"].reset_index()
 
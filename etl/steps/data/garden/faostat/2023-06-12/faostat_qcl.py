@@ -453,7 +453,9 @@ def run(dest_dir: str) -> None:
     ds_meadow: catalog.Dataset = paths.load_dependency(dataset_short_name)
     # Load main table from dataset.
     tb_meadow = ds_meadow[dataset_short_name]
-    data = pd.DataFrame(tb_meadow).reset_index()
+    # NOTE: Resetting the index in place of a plain (shallow) dataframe avoids copying the full table.
+    data = pd.DataFrame(tb_meadow)
+    data.reset_index(inplace=True)
 
     # Load dataset of FAOSTAT metadata.
     metadata: catalog.Dataset = paths.load_dependency(f"{NAMESPACE}_metadata")
@@ -154,7 +154,17 @@ def fill_slaughtered_poultry_with_slaughtered_chicken(tb: Table) -> Table:
         "slaughtered chicken."
     )
     # Add chicken data to the full table.
-    tb = pr.concat([tb, poultry_slaughtered_missing_data], ignore_index=True)
+    # NOTE: Columns of new strings are not categorical; convert them back to categorical, so that subsequent comparisons
+    # (e.g. when adding slaughtered animals to meat total) are done on category codes instead of strings.
+    tb = pr.concat([tb, poultry_slaughtered_missing_data], ignore_index=True).astype(
+        {
+            "item_code": "category",
+            "item": "category",
+            "fao_item": "category",
+            "fao_unit_short_name": "category",
+            "item_description": "category",
+        }
+    )
 
     return tb
 
@@ -186,26 +196,30 @@ def add_slaughtered_animals_to_meat_total(tb: Table) -> Table:
     assert SLAUGHTERED_ANIMALS_ELEMENT in set(tb["element"])
     assert SLAUGHTERED_ANIMALS_UNIT in set(tb["unit"])
 
+    # Masks that are used multiple times below (computed only once, to avoid scanning the full table repeatedly).
+    is_slaughtered_animals_element = tb["element"] == SLAUGHTERED_ANIMALS_ELEMENT
+    is_slaughtered_animals_unit = tb["unit"] == SLAUGHTERED_ANIMALS_UNIT
+    is_slaughtered_animals_element_code = tb["element_code"].isin(SLAUGHTERED_ANIMALS_ELEMENT_CODES)
+    is_total_meat_item = tb["item"] == TOTAL_MEAT_ITEM
+
     # Check that there are two element codes for the same element (they have different items assigned).
     error = "Element codes for 'Producing or slaughtered animals' may have changed."
     assert (
-        tb[(tb["element"] == SLAUGHTERED_ANIMALS_ELEMENT) & ~(tb["element_code"].str.contains("pc"))]["element_code"]
-        .unique()
-        .tolist()
+        tb[is_slaughtered_animals_element & ~(tb["element_code"].str.contains("pc"))]["element_code"].unique().tolist()
         == SLAUGHTERED_ANIMALS_ELEMENT_CODES
     ), error
 
     # Check that they use the same unit.
     error = "Unit for element 'Producing or slaughtered animals' may have changed."
-    assert set(tb[(tb["element"] == SLAUGHTERED_ANIMALS_ELEMENT)]["unit"]) == set(["animals"]), error
+    assert set(tb[is_slaughtered_animals_element]["unit"]) == set(["animals"]), error
 
     # Check that, indeed, the number of slaughtered animals for total meat is not given in the original data.
-    assert tb[(tb["item"] == TOTAL_MEAT_ITEM) & (tb["element"] == SLAUGHTERED_ANIMALS_ELEMENT)].empty
+    assert tb[is_total_meat_item & is_slaughtered_animals_element].empty
 
     # Check that the items assigned to each the two element codes do not overlap.
     error = "Element codes for 'Producing or slaughtered animals' have overlapping items."
     items_for_different_elements = (
-        tb[(tb["element_code"].isin(SLAUGHTERED_ANIMALS_ELEMENT_CODES))]
+        tb[is_slaughtered_animals_element_code]
         .groupby("element_code", observed=True)
         .agg({"item_code": lambda x: list(x.unique())})
         .to_dict()["item_code"]
@@ -214,22 +228,18 @@ def add_slaughtered_animals_to_meat_total(tb: Table) -> Table:
 
     # Confirm the item code for total meat.
     error = f"Item code for '{TOTAL_MEAT_ITEM}' may have changed."
-    assert list(tb[tb["item"] == TOTAL_MEAT_ITEM]["item_code"].unique()) == [TOTAL_MEAT_ITEM_CODE], error
+    assert list(tb[is_total_meat_item]["item_code"].unique()) == [TOTAL_MEAT_ITEM_CODE], error
 
     # Select the subset of data to aggregate.
-    data_to_aggregate = (
-        tb[
-            (tb["element"] == SLAUGHTERED_ANIMALS_ELEMENT)
-            & (tb["unit"] == SLAUGHTERED_ANIMALS_UNIT)
-            & (tb["item_code"].isin(MEAT_TOTAL_ITEM_CODES))
-        ]
-        .dropna(subset="value")
-        .reset_index(drop=True)
-    )
+    data_to_aggregate = tb[
+        is_slaughtered_animals_element & is_slaughtered_animals_unit & (tb["item_code"].isin(MEAT_TOTAL_ITEM_CODES))
+    ].dropna(subset="value", ignore_index=True)
 
     # Create a table with the total number of animals used for meat.
+    # NOTE: Instead of aggregating flags with a (slow) Python function, take the first flag of each group and count the
+    # number of rows in each group (to then assign the flag of multiple flags to groups with more than one row).
     animals = dataframes.groupby_agg(
-        data_to_aggregate,
+        data_to_aggregate.assign(**{"n_rows": 1}),
         groupby_columns=[
             "area_code",
             "fao_country",
@@ -240,31 +250,39 @@ def add_slaughtered_animals_to_meat_total(tb: Table) -> Table:
         ],
         aggregations={
             "value": "sum",
-            "flag": lambda x: x if len(x) == 1 else FLAG_MULTIPLE_FLAGS,
+            "flag": "first",
+            "n_rows": "sum",
         },
         # TODO: Consider relaxing this assumption, and letting it be None (and impose min_num_values=1).
         num_allowed_nans=0,
     ).reset_index()
+    animals["flag"] = np.where(
+        (animals["n_rows"] == 1) | animals["flag"].isnull(), animals["flag"].astype(object), FLAG_MULTIPLE_FLAGS
+    )
+    animals = animals.drop(columns=["n_rows"])
 
     # Get element description for selected element code (so far it's always been an empty string).
-    _slaughtered_animals_element_description = tb[tb["element_code"].isin(SLAUGHTERED_ANIMALS_ELEMENT_CODES)][
-        "element_description"
-    ].unique()
+    _slaughtered_animals_element_description = tb[is_slaughtered_animals_element_code]["element_description"].unique()
     assert len(_slaughtered_animals_element_description) == 1
     slaughtered_animals_element_description = _slaughtered_animals_element_description[0]
 
+    # Select the item, description and unit fields of the total meat item code (only once).
+    tb_total_meat = tb.loc[
+        tb["item_code"] == TOTAL_MEAT_ITEM_CODE, ["item_description", "fao_item", "fao_unit_short_name"]
+    ]
+
     # Get item description for selected item code.
-    _total_meat_item_description = tb[tb["item_code"] == TOTAL_MEAT_ITEM_CODE]["item_description"].unique()
+    _total_meat_item_description = tb_total_meat["item_description"].unique()
     assert len(_total_meat_item_description) == 1
     total_meat_item_description = _total_meat_item_description[0]
 
     # Get FAO item name for selected item code.
-    _total_meat_fao_item = tb[tb["item_code"] == TOTAL_MEAT_ITEM_CODE]["fao_item"].unique()
+    _total_meat_fao_item = tb_total_meat["fao_item"].unique()
     assert len(_total_meat_fao_item) == 1
     total_meat_fao_item = _total_meat_fao_item[0]
 
     # Get FAO unit for selected item code.
-    _total_meat_fao_unit = tb[tb["item_code"] == TOTAL_MEAT_ITEM_CODE]["fao_unit_short_name"].unique()
+    _total_meat_fao_unit = tb_total_meat["fao_unit_short_name"].unique()
     assert len(_total_meat_fao_unit) == 1
     total_meat_fao_unit = _total_meat_fao_unit[0]
 
@@ -292,14 +310,9 @@ def add_slaughtered_animals_to_meat_total(tb: Table) -> Table:
 
     # Find country-years for which we have the number of poultry slaughtered.
     country_years_with_poultry_data = (
-        tb[
-            (tb["item_code"] == ITEM_CODE_MEAT_POULTRY)
-            & (tb["element"] == SLAUGHTERED_ANIMALS_ELEMENT)
-            & (tb["unit"] == SLAUGHTERED_ANIMALS_UNIT)
-        ]
+        tb[(tb["item_code"] == ITEM_CODE_MEAT_POULTRY) & is_slaughtered_animals_element & is_slaughtered_animals_unit]
         .dropna(subset="value")[["country", "year"]]
-        .drop_duplicates()
-        .reset_index(drop=True)
+        .drop_duplicates(ignore_index=True)
     )
 
     # Add a column to inform of all those rows for which we don't have poultry data.
@@ -318,25 +331,27 @@ def add_slaughtered_animals_to_meat_total(tb: Table) -> Table:
     assert set(tb.columns) == set(animals_corrected.columns)
 
     # Add animals data to the original table.
-    tb_combined = (
-        pr.concat([tb, animals_corrected], ignore_index=True)
-        .reset_index(drop=True)
-        .astype(
-            {
-                "element_code": "category",
-                "item_code": "category",
-                "fao_item": "category",
-                "fao_unit_short_name": "category",
-                "flag": "category",
-                "item": "category",
-                "item_description": "category",
-                "element": "category",
-                "unit": "category",
-                "element_description": "category",
-                "unit_short_name": "category",
-            }
-        )
-    )
+    # NOTE: New rows are made categorical before concatenating, so that categories are combined (instead of converting
+    # the full columns to object and then recategorizing them). Converting the result is then cheap, and only ensures
+    # that all those columns are categorical.
+    categorical_columns = {
+        column: "category"
+        for column in [
+            "element_code",
+            "item_code",
+            "fao_item",
+            "fao_unit_short_name",
+            "flag",
+            "item",
+            "item_description",
+            "element",
+            "unit",
+            "element_description",
+            "unit_short_name",
+        ]
+    }
+    animals_corrected = animals_corrected.astype(categorical_columns)
+    tb_combined = pr.concat([tb, animals_corrected], ignore_index=True).astype(categorical_columns)
 
     return tb_combined
 
@@ -371,11 +386,15 @@ def add_yield_to_aggregate_regions(data: Table) -> Table:
     area_element_code = "005312"
     yield_element_code = "005419"
 
+    # Masks that are used multiple times below (computed only once, to avoid scanning the full table repeatedly).
+    is_region = data["country"].isin(REGIONS_TO_ADD)
+    is_yield = data["element_code"] == yield_element_code
+
     # Check that indeed regions do not contain any data for yield.
-    assert data[(data["country"].isin(REGIONS_TO_ADD)) & (data["element_code"] == yield_element_code)].empty
+    assert data[is_region & is_yield].empty
 
     # Gather all fields that should stay the same.
-    additional_fields = data[data["element_code"] == yield_element_code][
+    additional_fields = data[is_yield][
         [
             "element",
             "element_description",
@@ -388,22 +407,15 @@ def add_yield_to_aggregate_regions(data: Table) -> Table:
     assert len(additional_fields) == 1
 
     # Create a table of production of regions.
-    data_production = data[(data["country"].isin(REGIONS_TO_ADD)) & (data["element_code"] == production_element_code)]
+    data_production = data[is_region & (data["element_code"] == production_element_code)]
 
     # Create a table of area of regions.
-    data_area = data[(data["country"].isin(REGIONS_TO_ADD)) & (data["element_code"] == area_element_code)]
+    data_area = data[is_region & (data["element_code"] == area_element_code)]
 
     # Merge the two tables and create the new yield variable.
-    merge_cols = [
-        "area_code",
-        "year",
-        "item_code",
-        "fao_country",
-        "fao_item",
-        "item",
-        "item_description",
-        "country",
-    ]
+    # NOTE: Country names are determined by area code, and item names and descriptions are determined by item code.
+    # Therefore, it suffices to merge on codes and year (which is much faster than also merging on all string columns).
+    merge_cols = ["area_code", "year", "item_code"]
     combined = data_production.merge(
         data_area[merge_cols + ["flag", "value"]],
         on=merge_cols,
@@ -411,20 +423,23 @@ def add_yield_to_aggregate_regions(data: Table) -> Table:
         suffixes=("_production", "_area"),
     )
 
-    combined["value"] = combined["value_production"] / combined["value_area"]
-
-    # Replace infinities (caused by dividing by zero) by nan.
-    combined["value"] = combined["value"].replace(np.inf, np.nan)
+    # Divide production by area, making nan any yield where area is zero (instead of creating infinities and then
+    # replacing them by nan).
+    value_production = combined["value_production"].to_numpy(dtype=float)
+    value_area = combined["value_area"].to_numpy(dtype=float)
+    combined["value"] = np.divide(
+        value_production, value_area, out=np.full(len(combined), np.nan), where=value_area != 0
+    )
+    combined["value"].metadata = combined["value_production"].metadata.copy()
 
     # If both fields have the same flag, use that, otherwise use the flag of multiple flags.
-    combined["flag"] = [
-        flag_production if flag_production == flag_area else FLAG_MULTIPLE_FLAGS
-        for flag_production, flag_area in zip(combined["flag_production"], combined["flag_area"])
-    ]
+    flag_production = combined["flag_production"].to_numpy(dtype=object)
+    flag_area = combined["flag_area"].to_numpy(dtype=object)
+    combined["flag"] = np.where(flag_production == flag_area, flag_production, FLAG_MULTIPLE_FLAGS)
 
     # Drop rows of nan and unnecessary columns.
     combined = combined.drop(columns=["flag_production", "flag_area", "value_production", "value_area"])
-    combined = combined.dropna(subset="value").reset_index(drop=True)
+    combined = combined.dropna(subset="value", ignore_index=True)
 
     # Replace fields appropriately.
     combined["element_code"] = yield_element_code
@@ -432,22 +447,23 @@ def add_yield_to_aggregate_regions(data: Table) -> Table:
     for field in additional_fields.columns:
         combined[field] = additional_fields[field].item()
     assert set(data.columns) == set(combined.columns)
-    combined_data = (
-        pr.concat([data, combined], ignore_index=True)
-        .reset_index(drop=True)
-        .astype(
-            {
-                "element_code": "category",
-                "fao_element": "category",
-                "fao_unit_short_name": "category",
-                "flag": "category",
-                "element": "category",
-                "unit": "category",
-                "element_description": "category",
-                "unit_short_name": "category",
-            }
-        )
-    )
+    # NOTE: New rows are made categorical before concatenating, so that categories are combined (instead of converting
+    # the full columns to object and then recategorizing them).
+    categorical_columns = {
+        column: "category"
+        for column in [
+            "element_code",
+            "fao_element",
+            "fao_unit_short_name",
+            "flag",
+            "element",
+            "unit",
+            "element_description",
+            "unit_short_name",
+        ]
+    }
+    combined = combined.astype(categorical_columns)
+    combined_data = pr.concat([data, combined], ignore_index=True).astype(categorical_columns)
 
     return combined_data
 
@@ -303,6 +303,9 @@ FLAGS_RANKING = (
     .reset_index()
     .rename(columns={"index": "ranking"})
 )
+assert FLAGS_RANKING["flag"].is_unique, "Flags in FLAGS_RANKING must be unique."
+# Map each flag to its ranking (where nan flag is replaced by FLAG_OFFICIAL_DATA, as done in the data).
+FLAG_TO_RANKING = dict(zip(FLAGS_RANKING["flag"].fillna(FLAG_OFFICIAL_DATA), FLAGS_RANKING["ranking"]))
 
 # Additional descriptions.
 
@@ -337,10 +340,10 @@ def check_that_countries_are_well_defined(tb: Table) -> None:
 
     """
     # Ensure area codes and countries are well defined, and no ambiguities were introduced when mapping country names.
-    n_countries_per_area_code = tb.groupby("area_code")["country"].transform("nunique")
+    # NOTE: All checks can be done on the (small) table of unique pairs of area code and country.
+    area_code_country_pairs = tb[["area_code", "country"]].drop_duplicates()
     ambiguous_area_codes = (
-        tb.loc[n_countries_per_area_code > 1][["area_code", "country"]]
-        .drop_duplicates()
+        area_code_country_pairs[area_code_country_pairs["area_code"].duplicated(keep=False)]
         .set_index("area_code")["country"]
         .to_dict()
     )
@@ -349,10 +352,8 @@ def check_that_countries_are_well_defined(tb: Table) -> None:
         f"Redefine countries file for:\n{ambiguous_area_codes}."
     )
     assert len(ambiguous_area_codes) == 0, error
-    n_area_codes_per_country = tb.groupby("country")["area_code"].transform("nunique")
     ambiguous_countries = (
-        tb.loc[n_area_codes_per_country > 1][["area_code", "country"]]
-        .drop_duplicates()
+        area_code_country_pairs[area_code_country_pairs["country"].duplicated(keep=False)]
         .set_index("area_code")["country"]
         .to_dict()
     )
@@ -396,6 +397,35 @@ def check_that_regions_with_subregions_are_ignored_when_constructing_aggregates(
     assert len(countries_with_subregions) == 0, error
 
 
+def zfill_as_categorical(codes: Variable, n_characters: int) -> pd.Categorical:
+    """Convert codes into strings of a fixed length (prepended with zeros), and return them as a categorical.
+
+    Only the unique codes are converted to strings (instead of all rows, which can be millions).
+
+    Parameters
+    ----------
+    codes : Variable
+        Original codes (either numbers or strings).
+    n_characters : int
+        Number of characters of the resulting codes.
+
+    Returns
+    -------
+    codes_filled : pd.Categorical
+        Codes as strings of a fixed length.
+
+    """
+    # Get the unique codes, and the position of each row in the list of unique codes.
+    positions, unique_codes = pd.factorize(codes, use_na_sentinel=False)
+    # Convert unique codes to strings of a fixed length (different unique codes may lead to the same string, e.g. 1 and
+    # "1", so they need to be deduplicated again).
+    categories, positions_in_categories = np.unique(
+        [str(code).zfill(n_characters) for code in unique_codes], return_inverse=True
+    )
+
+    return pd.Categorical.from_codes(positions_in_categories[positions], categories=categories)
+
+
 def harmonize_items(tb: Table, dataset_short_name: str, item_col: str = "item") -> Table:
     """Harmonize item codes (by ensuring they are strings of numbers with a fixed length, prepended with zeros), make
     amendments to faulty items, and make item codes and items of categorical dtype.
@@ -415,19 +445,16 @@ def harmonize_items(tb: Table, dataset_short_name: str, item_col: str = "item")
         Data after harmonizing item codes.
 
     """
-    tb = tb.copy()
-
     # Set the maximum number of characters for item_code.
     if dataset_short_name == f"{NAMESPACE}_sdgb":
         n_characters_item_code = N_CHARACTERS_ITEM_CODE_EXTENDED
     else:
         n_characters_item_code = N_CHARACTERS_ITEM_CODE
 
-    # Note: Here list comprehension is faster than doing .astype(str).str.zfill(...).
-    tb["item_code"] = [str(item_code).zfill(n_characters_item_code) for item_code in tb["item_code"]]
-
-    # Convert both columns to category to reduce memory.
-    tb = tb.astype({"item_code": "category", item_col: "category"})
+    # Convert both columns to category to reduce memory (padding item codes with zeros).
+    # NOTE: astype returns a new table, so there is no need to copy the original table before modifying it.
+    tb = tb.astype({item_col: "category"})
+    tb["item_code"] = zfill_as_categorical(tb["item_code"], n_characters=n_characters_item_code)
 
     # Fix those few cases where there is more than one item per item code within a given dataset.
     if dataset_short_name in ITEM_AMENDMENTS:
@@ -472,11 +499,10 @@ def harmonize_elements(
         Data after harmonizing element codes.
 
     """
-    tb = tb.copy()
-    tb["element_code"] = [str(element_code).zfill(N_CHARACTERS_ELEMENT_CODE) for element_code in tb["element_code"]]
-
-    # Convert both columns to category to reduce memory
-    tb = tb.astype({"element_code": "category", element_col: "category"})
+    # Convert both columns to category to reduce memory (padding element codes with zeros).
+    # NOTE: astype returns a new table, so there is no need to copy the original table before modifying it.
+    tb = tb.astype({element_col: "category"})
+    tb["element_code"] = zfill_as_categorical(tb["element_code"], n_characters=N_CHARACTERS_ELEMENT_CODE)
 
     # Fix those few cases where there is more than one item per item code within a given dataset.
     if dataset_short_name in ELEMENT_AMENDMENTS:
@@ -524,14 +550,22 @@ def harmonize_countries(tb: Table, countries_metadata: Table) -> Table:
         Data after harmonizing country names.
 
     """
-    tb = tb.copy()
+    # Only new columns are added to the table (before filtering it), so a shallow copy is enough.
+    tb = tb.copy(deep=False)
+
     # Add harmonized country names (from countries metadata) to data.
-    tb = tb.merge(
-        countries_metadata[["area_code", "fao_country", "country"]].rename(
-            columns={"fao_country": "fao_country_check"}
-        ),
-        on="area_code",
-        how="left",
+    # NOTE: Instead of merging the full data with the countries metadata (which would copy all columns), countries
+    # metadata is looked up for each unique area code, and then gathered for each row.
+    countries_metadata_indexed = countries_metadata.set_index("area_code")
+    assert countries_metadata_indexed.index.is_unique, "Area codes in countries metadata must be unique."
+    area_code_positions, unique_area_codes = pd.factorize(tb["area_code"], use_na_sentinel=False)
+    countries_for_area_codes = countries_metadata_indexed.reindex(unique_area_codes)
+    tb["fao_country_check"] = countries_for_area_codes["fao_country"].to_numpy()[area_code_positions]
+    tb["country"] = Variable(
+        countries_for_area_codes["country"].to_numpy()[area_code_positions],
+        index=tb.index,
+        name="country",
+        metadata=countries_metadata["country"].metadata.copy(),
     )
 
     # area_code should always be an int
@@ -637,7 +671,6 @@ def remove_rows_with_nan_value(tb: Table, verbose: bool = False) -> Table:
         Data after removing nan values.
 
     """
-    tb = tb.copy()
     # Number of rows with a nan in column "value".
     # We could also remove rows with any nan, however, before doing that, we would need to assign a value to nan flags.
     n_rows_with_nan_value = len(tb[tb["value"].isnull()])
@@ -670,9 +703,9 @@ def remove_columns_with_only_nans(tb: Table, verbose: bool = True) -> Table:
         Data after removing columns of nans.
 
     """
-    tb = tb.copy()
     # Remove columns that only have nans.
-    columns_of_nans = tb.columns[tb.isnull().all(axis=0)]
+    # NOTE: Counting non-null values per column avoids creating a boolean table of the same size as the data.
+    columns_of_nans = tb.columns[tb.count() == 0]
     if len(columns_of_nans) > 0:
         if verbose:
             log.info(
@@ -704,27 +737,32 @@ def remove_duplicates(tb: Table, index_columns: List[str], verbose: bool = True)
         Data (with a dummy numerical index) after removing duplicates.
 
     """
-    tb = tb.copy()
-
     # Select columns that will be used as indexes.
     _index_columns = [column for column in index_columns if column in tb.columns]
     # Number of ambiguous indexes (those that have multiple data values).
     n_ambiguous_indexes = len(tb[tb.duplicated(subset=_index_columns, keep="first")])
     if n_ambiguous_indexes > 0:
-        # Add flag ranking to dataset.
-        flags_ranking = FLAGS_RANKING.copy()
-        flags_ranking["flag"] = flags_ranking["flag"].fillna(FLAG_OFFICIAL_DATA)
-        tb = tb.merge(
-            flags_ranking[["flag", "ranking"]].rename(columns={"ranking": "flag_ranking"}),
-            on="flag",
-            how="left",
-        ).astype({"flag": "category"})
+        # Add flag ranking to dataset, by looking up the ranking of each flag category (instead of merging with the
+        # full data).
+        # NOTE: Flags without a ranking (and nan flags, whose code is -1, hence the appended last element) are given
+        # the lowest priority.
+        # NOTE: Rows are selected by position below, so start from a dummy numerical index (the incoming index may have
+        # duplicate labels).
+        tb = tb.reset_index(drop=True).astype({"flag": "category"})
+        ranking_per_flag_code = np.array(
+            [FLAG_TO_RANKING.get(flag, np.inf) for flag in tb["flag"].cat.categories] + [np.inf]
+        )
+        tb["flag_ranking"] = ranking_per_flag_code[tb["flag"].cat.codes.to_numpy()]
+
+        # Group flag rankings by index (so that index columns are hashed only once, and no global sort is needed).
+        flag_ranking_grouped = tb.groupby(_index_columns, sort=False, observed=True, dropna=False)["flag_ranking"]
 
         # Number of ambiguous indexes that cannot be solved using flags.
-        n_ambiguous_indexes_unsolvable = len(tb[tb.duplicated(subset=_index_columns + ["flag_ranking"], keep="first")])
+        n_ambiguous_indexes_unsolvable = (flag_ranking_grouped.size() - flag_ranking_grouped.nunique()).sum()
         # Remove ambiguous indexes (those that have multiple data values).
-        # When possible, use flags to prioritise among duplicates.
-        tb = tb.sort_values(_index_columns + ["flag_ranking"]).drop_duplicates(subset=_index_columns, keep="first")
+        # When possible, use flags to prioritise among duplicates (keeping the first row with the lowest flag ranking).
+        # Since the index is a range, the labels returned by idxmin are also row positions.
+        tb = tb.iloc[flag_ranking_grouped.idxmin().to_numpy()].sort_values(_index_columns)
         frac_ambiguous = n_ambiguous_indexes / len(tb)
         frac_ambiguous_solved_by_flags = 1 - (n_ambiguous_indexes_unsolvable / n_ambiguous_indexes)
         if verbose:
@@ -756,19 +794,21 @@ def clean_year_column(year_column: Variable) -> Variable:
         Clean column of years, as integer values.
 
     """
-    year_clean = []
-    for year in year_column:
+    # Parse only the unique year values (there are usually just a few dozens of them), instead of all rows.
+    positions, unique_years = pd.factorize(year_column, use_na_sentinel=False)
+    unique_years_clean = []
+    for year in unique_years:
         if "-" in str(year):
             year_range = year.split("-")
             year_min = int(year_range[0])
             year_max = int(year_range[1])
             assert year_max - year_min == 2
-            year_clean.append(year_min + 1)
+            unique_years_clean.append(year_min + 1)
         else:
-            year_clean.append(int(year))
+            unique_years_clean.append(int(year))
 
     # Prepare series of integer year values.
-    year_clean_series = Variable(year_clean, name="year")
+    year_clean_series = Variable(np.array(unique_years_clean, dtype=np.int64)[positions], name="year")
 
     return year_clean_series
 
@@ -811,45 +851,39 @@ def add_custom_names_and_descriptions(tb: Table, items_metadata: Table, elements
         Data after adding and editing its columns as described above.
 
     """
-    tb = tb.copy()
-
     error = "There are missing item codes in metadata."
     assert set(tb["item_code"]) <= set(items_metadata["item_code"]), error
 
     error = "There are missing element codes in metadata."
     assert set(tb["element_code"]) <= set(elements_metadata["element_code"]), error
 
+    # Index metadata tables by their codes, and join them to the data (with a single rename of the data columns).
+    # NOTE: validate="many_to_one" ensures that each code appears only once in the metadata.
+    items_metadata_indexed = items_metadata.set_index("item_code")[["owid_item", "owid_item_description"]]
+    elements_metadata_indexed = elements_metadata.set_index("element_code")[
+        [
+            "owid_element",
+            "owid_unit",
+            "owid_unit_factor",
+            "owid_element_description",
+            "owid_unit_short_name",
+        ]
+    ]
+    # Keep the categorical dtypes of codes, to restore them after joining (which is faster than recategorizing them).
+    codes_dtypes = {
+        column: tb[column].dtype if tb[column].dtype == "category" else "category"
+        for column in ["item_code", "element_code"]
+    }
     _expected_n_rows = len(tb)
-    tb = tb.rename(columns={"item": "fao_item"}, errors="raise").merge(
-        items_metadata[["item_code", "owid_item", "owid_item_description"]],
-        on="item_code",
-        how="left",
-    )
-    assert len(tb) == _expected_n_rows, "Something went wrong when merging data with items metadata."
-
-    tb = tb.rename(columns={"element": "fao_element", "unit": "fao_unit_short_name"}, errors="raise").merge(
-        elements_metadata[
-            [
-                "element_code",
-                "owid_element",
-                "owid_unit",
-                "owid_unit_factor",
-                "owid_element_description",
-                "owid_unit_short_name",
-            ]
-        ],
-        on=["element_code"],
-        how="left",
+    tb = (
+        tb.rename(columns={"item": "fao_item", "element": "fao_element", "unit": "fao_unit_short_name"}, errors="raise")
+        .join(items_metadata_indexed, on="item_code", validate="many_to_one")
+        .join(elements_metadata_indexed, on="element_code", validate="many_to_one")
     )
-    assert len(tb) == _expected_n_rows, "Something went wrong when merging data with elements metadata."
+    assert len(tb) == _expected_n_rows, "Something went wrong when joining data with items and elements metadata."
 
-    # `category` type was lost during merge, convert it back
-    tb = tb.astype(
-        {
-            "element_code": "category",
-            "item_code": "category",
-        }
-    )
+    # `category` type was lost during join, convert it back (reusing the original categories)
+    tb = tb.astype(codes_dtypes)
 
     # Remove "owid_" from column names.
     tb = tb.rename(columns={column: column.replace("owid_", "") for column in tb.columns})
@@ -1481,7 +1515,9 @@ def clean_data(
         Processed data, ready to be made into a table for a garden dataset.
 
     """
-    tb = tb.copy()
+    # Columns are only replaced (not modified in place) before renaming (which creates a new table), so a shallow copy
+    # is enough to leave the original table untouched.
+    tb = tb.copy(deep=False)
 
     # Fix spurious data values (applying mapping in value_amendments.csv) and ensure column of values is float.
     tb["value"] = clean_data_values(tb["value"], amendments=amendments)
@@ -1712,62 +1748,77 @@ def prepare_wide_table(tb: Table) -> Table:
     # unique elements in "variable_name" (which should be as many as combinations of item-elements).
     # Note: We include area_code in the index for completeness, but by construction country-year should not have
     # duplicates.
-    # Note: `pivot` operation is usually faster on categorical columns
+    # Note: Instead of using `pivot` (which is slow and memory hungry for such a large number of columns), data values
+    # are scattered into a preallocated array, using the group number of each row (area_code-country-year) and the
+    # categorical code of each variable name.
     log.info("prepare_wide_table.pivot", shape=tb.shape)
-    # Create a wide table with just the data values.
-    tb_wide = tb.pivot(
-        index=["area_code", "country", "year"],
-        columns=["variable_name"],
-        values="value",
+    index_columns = ["area_code", "country", "year"]
+    # NOTE: Variable names are sorted, so that columns of the final table are already sorted.
+    variable_names = tb["variable_name"].cat.remove_unused_categories()
+    variable_names = variable_names.cat.reorder_categories(sorted(variable_names.cat.categories))
+    # NOTE: Rows are numbered in the order of country and year, so that the final table is already sorted.
+    row_codes = tb.groupby(["country", "year", "area_code"], observed=True, sort=True).ngroup().to_numpy()
+    column_codes = variable_names.cat.codes.to_numpy().astype(np.int64)
+    n_rows = row_codes.max() + 1 if len(row_codes) > 0 else 0
+    n_columns = len(variable_names.cat.categories)
+    error = "Index contains duplicate entries, cannot create wide table."
+    assert not pd.Series(row_codes * n_columns + column_codes).duplicated().any(), error
+    values = np.full((n_rows, n_columns), np.nan)
+    values[row_codes, column_codes] = tb["value"].to_numpy()
+    # Index of the wide table (one row for each group, in the same order as the group numbers).
+    _, first_row_in_group = np.unique(row_codes, return_index=True)
+    index = pd.MultiIndex.from_frame(pd.DataFrame(tb[index_columns]).iloc[first_row_in_group])
+    # Create a wide table with just the data values (keeping table metadata, and metadata of index columns).
+    tb_wide = Table(
+        pd.DataFrame(values, index=index, columns=variable_names.cat.categories.rename("variable_name")), like=tb
     )
 
     # Add metadata to each new variable in the wide data table.
     log.info("prepare_wide_table.adding_metadata", shape=tb_wide.shape)
 
-    # Add variable name.
-    for column in tb_wide.columns:
-        tb_wide[column].metadata.title = column
-
-    # Add variable unit (long name).
-    variable_name_mapping = _variable_name_map(tb, "unit")
-    for column in tb_wide.columns:
-        tb_wide[column].metadata.unit = variable_name_mapping[column]
-
+    # Gather metadata fields of each variable (from the unique combinations of variable names and non-nan values of each
+    # field), and ensure that each variable maps to only one value of each field.
+    metadata_columns = ["unit", "variable_description", "variable_display_name"]
     if "unit_short_name" in tb.columns:
-        # Add variable unit (short name).
-        variable_name_mapping = _variable_name_map(tb, "unit_short_name")
-        for column in tb_wide.columns:
-            tb_wide[column].metadata.short_unit = variable_name_mapping[column]
-    else:
-        # This is the case for faostat_qv since the last update.
-        for column in tb_wide.columns:
-            tb_wide[column].metadata.short_unit = ""
-
-    # Add variable description.
-    variable_name_mapping = _variable_name_map(tb, "variable_description")
-    for column in tb_wide.columns:
-        tb_wide[column].metadata.description_from_producer = variable_name_mapping[column]
+        metadata_columns.append("unit_short_name")
+    variables_metadata = {}
+    for field in metadata_columns:
+        mapping = pd.DataFrame(tb[["variable_name", field]]).dropna().drop_duplicates()
+        assert mapping["variable_name"].is_unique, f"Variables must have a unique {field}."
+        variables_metadata[field] = mapping.set_index("variable_name")[field].to_dict()
 
-    # Add display and presentation parameters (for grapher).
-    variable_name_mapping = _variable_name_map(tb, "variable_display_name")
     for column in tb_wide.columns:
-        tb_wide[column].metadata.display = {"name": variable_name_mapping[column]}
-        tb_wide[column].metadata.presentation = VariablePresentationMeta(title_public=variable_name_mapping[column])
+        # Add variable name (on top of the metadata of the original column of values).
+        tb_wide[column].metadata = tb["value"].metadata.copy()
+        tb_wide[column].metadata.title = column
+        # Add variable unit (long name and short name).
+        tb_wide[column].metadata.unit = variables_metadata["unit"][column]
+        # NOTE: There is no short unit for faostat_qv since the last update.
+        if "unit_short_name" in variables_metadata:
+            tb_wide[column].metadata.short_unit = variables_metadata["unit_short_name"][column]
+        else:
+            tb_wide[column].metadata.short_unit = ""
+        # Add variable description.
+        tb_wide[column].metadata.description_from_producer = variables_metadata["variable_description"][column]
+        # Add display and presentation parameters (for grapher).
+        display_name = variables_metadata["variable_display_name"][column]
+        tb_wide[column].metadata.display = {"name": display_name}
+        tb_wide[column].metadata.presentation = VariablePresentationMeta(title_public=display_name)
 
     # Ensure columns have the optimal dtypes, but codes are categories.
     log.info("prepare_wide_table.optimize_table_dtypes", shape=tb_wide.shape)
     tb_wide = optimize_table_dtypes(table=tb_wide.reset_index())
 
-    # Sort columns and rows conveniently.
-    tb_wide = tb_wide.set_index(["country", "year"], verify_integrity=True)
-    tb_wide = tb_wide[["area_code"] + sorted([column for column in tb_wide.columns if column != "area_code"])]
-    tb_wide = tb_wide.sort_index(level=["country", "year"]).sort_index()
+    # Set an appropriate index.
+    # NOTE: Columns (area_code first, followed by variables) and rows were already constructed in a convenient order, so
+    # sorting the index is just a (cheap) safety check.
+    tb_wide = tb_wide.set_index(["country", "year"], verify_integrity=True).sort_index()
 
     # Make all column names snake_case.
+    # NOTE: The title of each variable coincides with its column name, so there is no need to access the metadata of
+    # each column (which is slow for such a wide table).
     variable_to_short_name = {
-        column: create_variable_short_names(variable_name=tb_wide[column].metadata.title)
-        for column in tb_wide.columns
-        if tb_wide[column].metadata.title is not None
+        column: create_variable_short_names(variable_name=column) for column in tb_wide.columns if column != "area_code"
     }
     tb_wide = tb_wide.rename(columns=variable_to_short_name, errors="raise")
 
@@ -1778,14 +1829,6 @@ def prepare_wide_table(tb: Table) -> Table:
     return tb_wide
 
 
-def _variable_name_map(data: Table, column: str) -> Dict[str, str]:
-    """Extract map {variable name -> column} from dataframe and make sure it is unique (i.e. ensure that one variable
-    does not map to two distinct values)."""
-    pivot = data.dropna(subset=[column]).groupby(["variable_name"], observed=True)[column].apply(set)
-    assert all(pivot.map(len) == 1)
-    return pivot.map(lambda x: list(x)[0]).to_dict()  # type: ignore
-
-
 def parse_amendments_table(amendments: Table, dataset_short_name: str):
     amendments = Table(amendments).reset_index()
     # Create a dictionary mapping spurious values to amended values.
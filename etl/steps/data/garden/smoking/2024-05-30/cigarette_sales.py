@@ -80,12 +80,8 @@ def include_split_germany(tb, ds_population):
     germany_tb = geo.add_population_to_table(germany_tb, ds_population, interpolate_missing_population=True)
 
     # calculate share of population for each year
-    added_pop = germany_tb[["year", "population"]].groupby("year").sum().reset_index()
-
-    for idx, row in germany_tb.iterrows():
-        germany_tb.loc[idx, "share_of_population"] = (
-            row["population"] / added_pop[added_pop["year"] == row["year"]]["population"].values[0]
-        )
+    total_population = germany_tb.groupby("year")["population"].transform("sum")
+    germany_tb["share_of_population"] = germany_tb["population"] / total_population
     # calculate share of cigarettes per adult for weighted average
     germany_tb[col_manufactured] = germany_tb[col_manufactured] * germany_tb["share_of_population"]
     germany_tb[col_handrolled] = germany_tb[col_handrolled] * germany_tb["share_of_population"]
@@ -17,6 +17,19 @@ log = get_logger()
 # Get paths and naming conventions for current step.
 paths = PathFinder(__file__)
 
+# IHR Capacity codes that duplicate the labelling of other attributes, and the codes they should be replaced with.
+IHR_CAPACITY_RECODES = {
+    "IHR02": "SPAR02",
+    "IHR03": "SPAR06",
+    "IHR06": "SPAR10",
+    "IHR07": "SPAR07",
+    "IHR08": "SPAR05",
+    "IHR09": "SPAR11",
+    "IHR10": "SPAR03",
+    "IHR11": "SPAR04",
+    "IHR12": "SPAR12",
+}
+
 
 def run(dest_dir: str) -> None:
     log.info("un_sdg.start")
@@ -29,11 +42,15 @@ def run(dest_dir: str) -> None:
     # Read table from meadow dataset.
     tb_meadow = ds_meadow[paths.short_name]
 
+    # Load descriptions of units and dimensions.
+    unit_description = get_attributes_description()
+    dim_description = get_dimension_description()
+
     # Create a dataframe with data from the table.
     df = pd.DataFrame(tb_meadow)
 
     # Create long and short units columns
-    df = create_units(df)
+    df = create_units(df, unit_description=unit_description)
 
     df = manual_clean_data(df)
     df = remove_cities(df)
@@ -46,7 +63,7 @@ def run(dest_dir: str) -> None:
     )
 
     # Create a new table with the processed data.
-    all_tables = create_tables(df)
+    all_tables = create_tables(df, dim_description=dim_description)
 
     # Creating OMMs
     all_tables = create_omms(all_tables)
@@ -74,13 +91,14 @@ def run(dest_dir: str) -> None:
     log.info("un_sdg.end")
 
 
-def create_units(df: pd.DataFrame) -> pd.DataFrame:
+def create_units(df: pd.DataFrame, unit_description: Dict) -> pd.DataFrame:
     df = df.copy(deep=False)
-    unit_description = get_attributes_description()
     df["long_unit"] = df["units"].map(unit_description)
     # df["long_unit"][df["seriescode"] == "SL_ISV_IFEM"] = "Percentage"
     assert df["long_unit"].isna().sum() == 0
-    df["short_unit"] = create_short_unit(df["long_unit"])
+    # NOTE: There are only a few distinct units, so short units are found once per unit (instead of once per row).
+    long_units = pd.Series(df["long_unit"].unique())
+    df["short_unit"] = df["long_unit"].map(dict(zip(long_units, create_short_unit(long_units))))
     return df
 
 
@@ -122,37 +140,15 @@ def manual_clean_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     df = df.copy(deep=False)
 
-    df["value"] = df["value"].astype(float)
     df.loc[
         (df["long_unit"] == "Percentage") & (df["value"] > 100) & (df["indicator"] == "15.2.1"),
         "value",
     ] = 100
 
     # Clean the IHR Capacity column, duplicate labelling of some attributes which doesn't work well with the grapher
-    df["ihr_capacity"] = df["ihr_capacity"].replace(
-        [
-            "IHR02",
-            "IHR03",
-            "IHR06",
-            "IHR07",
-            "IHR08",
-            "IHR09",
-            "IHR10",
-            "IHR11",
-            "IHR12",
-        ],
-        [
-            "SPAR02",
-            "SPAR06",
-            "SPAR10",
-            "SPAR07",
-            "SPAR05",
-            "SPAR11",
-            "SPAR03",
-            "SPAR04",
-            "SPAR12",
-        ],
-    )
+    # NOTE: On a categorical column, the function is only applied to categories (and recoded categories that coincide
+    # with existing ones are merged). The result is made categorical again, in case the input was not.
+    df["ihr_capacity"] = df["ihr_capacity"].map(lambda code: IHR_CAPACITY_RECODES.get(code, code)).astype("category")
     df = df.drop(["level_0", "index"], axis=1, errors="ignore")
 
     return df
@@ -173,16 +169,19 @@ def remove_cities(df: pd.DataFrame) -> pd.DataFrame:
     return original_df
 
 
-def create_tables(original_df: pd.DataFrame) -> List[pd.DataFrame]:
+def create_tables(original_df: pd.DataFrame, dim_description: dict[str, Any]) -> List[pd.DataFrame]:
     original_df = original_df.copy(deep=False)
 
-    dim_description = get_dimension_description()
     init_dimensions = list(dim_description.keys())
     init_dimensions = list(set(init_dimensions).intersection(list(original_df.columns)))
     init_dimensions = sorted(init_dimensions)
     init_non_dimensions = list([c for c in original_df.columns if c not in set(init_dimensions)])
     init_non_dimensions = sorted(init_non_dimensions)
-    all_series = original_df.groupby(["indicator", "seriescode"])
+    # NOTE: Group by categorical versions of the keys, so that groups are found by comparing integer codes instead of
+    # strings, while the columns of each group keep their original dtype.
+    all_series = original_df.groupby(
+        [original_df["indicator"].astype("category"), original_df["seriescode"].astype("category")], observed=True
+    )
 
     output_tables = []
     len_dimensions = []
@@ -295,15 +294,11 @@ def get_series_with_relevant_dimensions(
     - unique values for each relevant dimension
     """
 
-    non_null_dimensions_columns = [col for col in init_dimensions if data_series.loc[:, col].notna().any()]
-    dimension_names = []
-
-    for c in non_null_dimensions_columns:
-        uniques = data_series[c].unique()
-        if (
-            len(uniques) > 1
-        ):  # Means that columns where the value doesn't change aren't included e.g. Nature is typically consistent across a dimension whereas Age and Sex are less likely to be.
-            dimension_names.append(c)
+    # Means that columns where the value doesn't change aren't included e.g. Nature is typically consistent across a
+    # dimension whereas Age and Sex are less likely to be. Columns that are all NaN have a single (NaN) value, so they
+    # are excluded too. All columns are inspected in a single pass.
+    n_values = data_series[init_dimensions].nunique(dropna=False)
+    dimension_names = n_values[n_values > 1].index.tolist()
     return (
         data_series.loc[
             :,
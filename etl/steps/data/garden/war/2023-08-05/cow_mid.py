@@ -227,7 +227,7 @@ def combine_tables(tb_a: Table, tb_b: Table) -> Table:
     tb.loc[tb["dispnum"] == 4005, "region"] = "Asia"
 
     # Check there is no NaN!
-    assert tb.notna().all().all(), "NaN in some field!"
+    assert not tb.isna().to_numpy().any(), "NaN in some field!"
 
     return tb
 
@@ -280,15 +280,14 @@ def expand_observations(tb: Table) -> Table:
     Table
         Here, each dispute has as many rows as years of activity. Its deaths have been uniformly distributed among the years of activity.
     """
-    # Add missing years for each triplet ("warcode", "campcode", "ccode")
-    YEAR_MIN = tb["styear"].min()
-    YEAR_MAX = tb["endyear"].max()
-    tb_all_years = pd.DataFrame(pd.RangeIndex(YEAR_MIN, YEAR_MAX + 1), columns=["year"])
-    df = pd.DataFrame(tb)  # to prevent error "AttributeError: 'DataFrame' object has no attribute 'all_columns'"
-    df = df.merge(tb_all_years, how="cross")  # type: ignore
-    tb = Table(df, metadata=tb.metadata)
-    # Filter only entries that actually existed
-    tb = tb[(tb["year"] >= tb["styear"]) & (tb["year"] <= tb["endyear"])]
+    # Repeat each dispute as many times as years it was active (instead of crossing all disputes with all years, and
+    # then filtering only entries that actually existed).
+    n_years = np.clip((tb["endyear"] - tb["styear"] + 1).fillna(0).to_numpy(dtype=int), 0, None)
+    year_start = np.repeat(tb["styear"].fillna(0).to_numpy(dtype=int), n_years)
+    # Position of each new row within the years of its dispute (0 for the start year, 1 for the next, etc.).
+    year_offset = np.arange(n_years.sum()) - np.repeat(np.cumsum(n_years) - n_years, n_years)
+    tb = tb.iloc[np.repeat(np.arange(len(tb)), n_years)].reset_index(drop=True)
+    tb["year"] = year_start + year_offset
 
     return tb
 
@@ -310,9 +309,10 @@ def estimate_metrics(tb: Table) -> Table:
         Table with a row per year, and the corresponding metrics of interest.
     """
     # Estimate metrics broken down by fatality
-    tb_fatality = _estimate_metrics_fatality(tb.copy())
+    # NOTE: These functions do not modify the input table, so there is no need to copy it.
+    tb_fatality = _estimate_metrics_fatality(tb)
     # Estimate metrics broken down by hostility
-    tb_hostility = _estimate_metrics_hostility(tb.copy())
+    tb_hostility = _estimate_metrics_hostility(tb)
 
     # Combine
     tb = pr.concat([tb_fatality, tb_hostility], ignore_index=False)
@@ -448,7 +448,9 @@ def replace_missing_data_with_zeros(tb: Table) -> Table:
     )
     # Only keep rows with "all" in fatality or hostility
     # That is, either break down indicators by fatality or by hostility
-    new_idx = [i for i in new_idx if (i[2] == "all") or (i[3] == "all")]
+    new_idx = new_idx[
+        (new_idx.get_level_values("fatality") == "all") | (new_idx.get_level_values("hostility") == "all")
+    ]
     tb = tb.set_index(["year", "region", "fatality", "hostility"], verify_integrity=True).reindex(new_idx).reset_index()
 
     # Change NaNs for 0 for specific rows
@@ -266,7 +266,7 @@ def combine_tables(tb_a: Table, tb_b: Table) -> Table:
     tb.loc[tb["dispnum"] == 4005, "region"] = "Asia and Oceania"
 
     # Check there is no NaN!
-    assert tb.notna().all().all(), "NaN in some field!"
+    assert not tb.isna().to_numpy().any(), "NaN in some field!"
 
     return tb
 
@@ -466,7 +466,9 @@ def replace_missing_data_with_zeros(tb: Table) -> Table:
     )
     # Only keep rows with "all" in fatality or hostility
     # That is, either break down indicators by fatality or by hostility
-    new_idx = [i for i in new_idx if (i[2] == "all") or (i[3] == "all")]
+    new_idx = new_idx[
+        (new_idx.get_level_values("fatality") == "all") | (new_idx.get_level_values("hostility") == "all")
+    ]
     tb = tb.set_index(["year", "region", "fatality", "hostility"], verify_integrity=True).reindex(new_idx).reset_index()
 
     # Change NaNs for 0 for specific rows
@@ -47,13 +47,14 @@ def expand_observations(
             if rounding:
                 tb[col] = tb[col].round()
 
-    # Add missing years for each triplet ("warcode", "campcode", "ccode")
-    YEAR_MIN = tb[col_year_start].min()
-    YEAR_MAX = tb[col_year_end].max()
-    tb_all_years = Table(pd.RangeIndex(YEAR_MIN, YEAR_MAX + 1), columns=["year"])
-    tb = tb.merge(tb_all_years, how="cross")
-    # Filter only entries that actually existed
-    tb = tb[(tb["year"] >= tb[col_year_start]) & (tb["year"] <= tb[col_year_end])]
+    # Repeat each conflict as many times as years it was active (instead of crossing all conflicts with all years, and
+    # then filtering only entries that actually existed).
+    n_years = np.clip((tb[col_year_end] - tb[col_year_start] + 1).fillna(0).to_numpy(dtype=int), 0, None)
+    year_start = np.repeat(tb[col_year_start].fillna(0).to_numpy(dtype=int), n_years)
+    # Position of each new row within the years of its conflict (0 for the start year, 1 for the next, etc.).
+    year_offset = np.arange(n_years.sum()) - np.repeat(np.cumsum(n_years) - n_years, n_years)
+    tb = tb.iloc[np.repeat(np.arange(len(tb)), n_years)].reset_index(drop=True)
+    tb["year"] = year_start + year_offset
 
     return tb
 
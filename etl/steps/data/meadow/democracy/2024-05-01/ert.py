@@ -13,26 +13,25 @@ def run(dest_dir: str) -> None:
     # Retrieve snapshot.
     snap = paths.load_snapshot("ert.csv")
 
-    # Load data from snapshot.
-    tb = snap.read()
+    # Load data from snapshot (parsing only the relevant columns).
+    columns = [
+        "country_name",
+        "year",
+        "reg_type",
+        "dem_ep",
+        "aut_ep",
+        "dem_ep_outcome",
+        "dem_ep_end_year",
+        "aut_ep_outcome",
+        "aut_ep_end_year",
+    ]
+    tb = snap.read(usecols=columns)
 
     #
     # Process data.
     #
-    # Keep relevant columns
-    tb = tb[
-        [
-            "country_name",
-            "year",
-            "reg_type",
-            "dem_ep",
-            "aut_ep",
-            "dem_ep_outcome",
-            "dem_ep_end_year",
-            "aut_ep_outcome",
-            "aut_ep_end_year",
-        ]
-    ]
+    # Sort columns conveniently (since usecols keeps the order of columns in the file).
+    tb = tb[columns]
 
     # Ensure all columns are snake-case, set an appropriate index, and sort conveniently.
     tb = tb.format(["country_name", "year"])
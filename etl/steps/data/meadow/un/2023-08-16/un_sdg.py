@@ -1,7 +1,5 @@
 """Load a snapshot and create a meadow dataset."""
 
-import re
-
 import pandas as pd
 from owid.catalog import Table
 from structlog import get_logger
@@ -14,6 +12,9 @@ log = get_logger()
 # Get paths and naming conventions for current step.
 paths = PathFinder(__file__)
 
+# Translation table that removes square brackets from column names.
+REMOVE_BRACKETS = str.maketrans("", "", "[]")
+
 
 def run(dest_dir: str) -> None:
     log.info("un_sdg.start")
@@ -43,9 +44,8 @@ def load_and_clean(original_df: pd.DataFrame) -> pd.DataFrame:
     original_df = original_df.copy(deep=False)
 
     # removing values that aren't numeric e.g. Null and N values
-    original_df.dropna(subset=["Value"], inplace=True)
-    original_df.dropna(subset=["TimePeriod"], how="all", inplace=True)
-    original_df = original_df.loc[pd.to_numeric(original_df["Value"], errors="coerce").notnull()]
+    original_df["Value"] = pd.to_numeric(original_df["Value"], errors="coerce")
+    original_df.dropna(subset=["Value", "TimePeriod"], inplace=True)
     original_df.rename(columns={"GeoAreaName": "Country", "TimePeriod": "Year"}, inplace=True)
-    original_df = original_df.rename(columns=lambda k: re.sub(r"[\[\]]", "", k))  # type: ignore
+    original_df.rename(columns=lambda k: k.translate(REMOVE_BRACKETS), inplace=True)  # type: ignore
     return original_df
@@ -144,19 +144,21 @@ class Dataset:
             table_filename = join(self.path, table.metadata.checked_name + f".{format}")
             table.to(table_filename, repack=repack)
 
-    def read_table(self, name: str, reset_index: bool = True) -> tables.Table:
+    def read_table(self, name: str, reset_index: bool = True, columns: Optional[List[str]] = None) -> tables.Table:
         """Read dataset's table from disk. Alternative to ds[table_name], but
         with more options to optimize the reading.
 
         :param reset_index: If true, don't set primary keys of the table. This can make loading
             large datasets with multi-indexes much faster.
+        :param columns: If given, read only these columns (which must include primary keys if
+            reset_index is False). Columns that are not read are never loaded into memory.
         """
         stem = self.path / Path(name)
 
         for format in SUPPORTED_FORMATS:
             path = stem.with_suffix(f".{format}")
             if path.exists():
-                t = tables.Table.read(path, primary_key=[] if reset_index else None)
+                t = tables.Table.read(path, primary_key=[] if reset_index else None, columns=columns)
                 # dataset metadata might have been updated, refresh it
                 t.metadata.dataset = self.metadata
                 return t
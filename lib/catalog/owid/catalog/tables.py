@@ -293,7 +293,7 @@ class Table(pd.DataFrame):
             json.dump(metadata, ostream, indent=2, default=str)
 
     @classmethod
-    def read_csv(cls, path: Union[str, Path], **kwargs) -> "Table":
+    def read_csv(cls, path: Union[str, Path], columns: Optional[List[str]] = None, **kwargs) -> "Table":
         """
         Read the table from csv plus accompanying JSON sidecar.
         """
@@ -304,7 +304,7 @@ class Table(pd.DataFrame):
             raise ValueError(f'filename must end in ".csv": {path}')
 
         # load the data and add metadata
-        df = Table(pd.read_csv(path, index_col=False, na_values=[""], keep_default_na=False))
+        df = Table(pd.read_csv(path, index_col=False, na_values=[""], keep_default_na=False, usecols=columns))
         cls._add_metadata(df, path, **kwargs)
         return df
 
@@ -332,7 +332,7 @@ class Table(pd.DataFrame):
             df.set_index(primary_key, inplace=True)
 
     @classmethod
-    def read_feather(cls, path: Union[str, Path], **kwargs) -> "Table":
+    def read_feather(cls, path: Union[str, Path], columns: Optional[List[str]] = None, **kwargs) -> "Table":
         """
         Read the table from feather plus accompanying JSON sidecar.
 
@@ -345,12 +345,12 @@ class Table(pd.DataFrame):
             raise ValueError(f'filename must end in ".feather": {path}')
 
         # load the data and add metadata
-        df = Table(pd.read_feather(path))
+        df = Table(pd.read_feather(path, columns=columns))
         cls._add_metadata(df, path, **kwargs)
         return df
 
     @classmethod
-    def read_parquet(cls, path: Union[str, Path], **kwargs) -> "Table":
+    def read_parquet(cls, path: Union[str, Path], columns: Optional[List[str]] = None, **kwargs) -> "Table":
         """
         Read the table from a parquet file plus accompanying JSON sidecar.
 
@@ -363,7 +363,7 @@ class Table(pd.DataFrame):
             raise ValueError(f'filename must end in ".parquet": {path}')
 
         # load the data and add metadata
-        df = Table(pd.read_parquet(path))
+        df = Table(pd.read_parquet(path, columns=columns))
         cls._add_metadata(df, path, **kwargs)
         return df
 
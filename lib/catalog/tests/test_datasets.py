@@ -194,6 +194,26 @@ def test_add_table_parquet():
         assert t2.equals_table(t)
 
 
+@pytest.mark.parametrize("format", ["feather", "parquet", "csv"])
+def test_read_table_columns(format):
+    t = mock_table()
+    t["population"] = [1, 2, 3]
+
+    with temp_dataset_dir() as dirname:
+        ds = Dataset.create_empty(dirname)
+        ds.add(t, formats=[format])
+
+        # read only some of the columns, without setting the index
+        t2 = ds.read_table(t.metadata.checked_name, columns=["country", "gdp"])
+        assert list(t2.columns) == ["country", "gdp"]
+        assert t2["gdp"].metadata.title == t["gdp"].metadata.title
+
+        # read only some of the columns, setting the index
+        t3 = ds.read_table(t.metadata.checked_name, reset_index=False, columns=["country", "population"])
+        assert t3.primary_key == ["country"]
+        assert list(t3.columns) == ["population"]
+
+
 def test_metadata_roundtrip():
     with temp_dataset_dir() as dirname:
         d = Dataset.create_empty(dirname)
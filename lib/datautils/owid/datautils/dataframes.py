@@ -530,14 +530,16 @@ def concatenate(objs: List[pd.DataFrame], **kwargs: Any) -> pd.DataFrame:
 
     Original source code from https://stackoverflow.com/a/57809778/1275818.
     """
+    # Work on shallow copies, so that the input dataframes are not modified (their data is not copied).
+    objs = [df.copy(deep=False) for df in objs]
     # Iterate on categorical columns common to all dfs
     for col in set.intersection(*[set(df.select_dtypes(include="category").columns) for df in objs]):
         ignore_order = any([not df[col].cat.ordered for df in objs])
         # Generate the union category across dfs for this column
         uc = union_categoricals([df[col] for df in objs], ignore_order=ignore_order)
-        # Change to union category for all dataframes
+        # Change to union category for all dataframes (replacing the column, instead of modifying it in place)
         for df in objs:
-            df.loc[:, col] = pd.Categorical(df[col].values, categories=uc.categories)
+            df[col] = pd.Categorical(df[col].values, categories=uc.categories)
 
     with warnings.catch_warnings():
         warnings.simplefilter(action="ignore", category=FutureWarning)
@@ -558,21 +560,18 @@ def apply_on_categoricals(cat_series: List[pd.Series], func: Callable[..., str])
     func :
         Function taking as many arguments as there are categorical series and returning str.
     """
-    seen = {}
-    codes = []
-    categories = []
-    for cat_codes in zip(*[s.cat.codes for s in cat_series]):
-        if cat_codes not in seen:
-            # add category
-            # -1 is a special code for missing values
-            cat_values = [s.cat.categories[code] if code != -1 else np.nan for s, code in zip(cat_series, cat_codes)]
-            categories.append(func(*cat_values))
-            seen[cat_codes] = len(categories) - 1
-
-        # use existing category
-        codes.append(seen[cat_codes])
-
-    return cast(pd.Series, pd.Categorical.from_codes(codes, categories=categories))
+    # Table of category codes (one column per series).
+    codes = pd.DataFrame({i: s.cat.codes.to_numpy() for i, s in enumerate(cat_series)})
+    # Assign an output code to each unique combination of codes (in order of appearance).
+    output_codes = codes.groupby(list(codes.columns), sort=False).ngroup().to_numpy()
+    # Apply the function only once on each unique combination of codes (in the same order of appearance).
+    # -1 is a special code for missing values
+    categories = [
+        func(*[s.cat.categories[code] if code != -1 else np.nan for s, code in zip(cat_series, cat_codes)])
+        for cat_codes in codes.drop_duplicates().itertuples(index=False)
+    ]
+
+    return cast(pd.Series, pd.Categorical.from_codes(output_codes, categories=categories))
 
 
 def combine_two_overlapping_dataframes(
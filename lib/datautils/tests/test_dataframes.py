@@ -1049,6 +1049,14 @@ class TestConcatenate:
         assert list(out.x.cat.categories) == ["a", "b"]
         assert out.to_dict(orient="records") == [{"x": "a", "d": 1}, {"x": "b", "d": 2}]
 
+    def test_concat_categoricals_does_not_modify_inputs(self):
+        a = pd.DataFrame({"x": ["a"]}).astype("category")
+        b = pd.DataFrame({"x": ["b"]}).astype("category")
+
+        dataframes.concatenate([a, b])
+        assert list(a.x.cat.categories) == ["a"]
+        assert list(b.x.cat.categories) == ["b"]
+
 
 class TestApplyOnCategoricals:
     def test_string_func(self):
@@ -1067,6 +1075,20 @@ class TestApplyOnCategoricals:
 
         assert list(new_desc) == ["a", "b per capita", " per capita"]
 
+    def test_repeated_combinations(self):
+        df = pd.DataFrame({"x": ["b", "a", "b", "a", "b"], "y": ["c", "c", "c", "d", "c"]}).astype("category")
+        calls = []
+
+        def func(x, y):
+            calls.append((x, y))
+            return f"{x}|{y}"
+
+        out = dataframes.apply_on_categoricals([df.x, df.y], func)
+        assert list(out) == ["b|c", "a|c", "b|c", "a|d", "b|c"]
+        # Categories are in order of appearance, and the function is called once per unique combination.
+        assert list(out.categories) == ["b|c", "a|c", "a|d"]
+        assert calls == [("b", "c"), ("a", "c"), ("a", "d")]
+
 
 class TestCombineTwoOverlappingDataFrames:
     def test_combine_dataframes(self):
@@ -7,6 +7,8 @@ import json
 import os
 import tempfile
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
 from typing import Any, Dict, List
@@ -17,6 +19,7 @@ import pandas as pd
 import requests
 import yaml
 from pandas.errors import ParserError
+from requests.adapters import HTTPAdapter
 from structlog import get_logger
 
 from etl.snapshot import Snapshot, SnapshotMeta, add_snapshot
@@ -27,6 +30,7 @@ log = get_logger()
 URL_METADATA = "https://unstats.un.org/sdgs/indicators/SDG_Updateinfo.xlsx"
 MAX_RETRIES = 10
 CHUNK_SIZE = 1024 * 1024 * 10
+MAX_WORKERS = 16
 
 
 # Version for current snapshot dataset.
@@ -207,57 +211,48 @@ def download_file(url: str, goal: str, area_codes: list, max_retries: int, bytes
 
 def attributes_description(snap: Snapshot) -> Dict[Any, Any]:
     """Gathers each of the unit codes and their more descriptive counterparts."""
-    goal_codes = get_goal_codes(snap)
-    a = []
-    assert snap.metadata.source
-    for goal in goal_codes:
-        url = f"{snap.metadata.source.source_data_url}/v1/sdg/Goal/{goal}/Attributes"
-        res = requests.get(url)
-        assert res.ok
-        attr = res.json()
+    att_dict: Dict[Any, Any] = {}
+    for attr in get_goal_resources(snap, resource="Attributes"):
         for att in attr:
             for code in att["codes"]:
-                a.append(
-                    {
-                        "code": code["code"],
-                        "description": code["description"],
-                    }
-                )
-    att_dict = pd.DataFrame(a).drop_duplicates().set_index("code").squeeze().to_dict()
+                att_dict[code["code"]] = code["description"]
     att_dict["PERCENT"] = "%"
     return att_dict
 
 
 def dimensions_description(snap: Snapshot) -> dict:
     """Gathers each of the dimension codes and their more descriptive versions. This updates regularly so is important to snapshot"""
-    goal_codes = get_goal_codes(snap)
-    d = []
-    assert snap.metadata.source
-    for goal in goal_codes:
-        url = f"{snap.metadata.source.source_data_url}/v1/sdg/Goal/{goal}/Dimensions"
-        res = requests.get(url)
-        assert res.ok
-        dims = res.json()
+    dim_dict = defaultdict(lambda: {np.nan: ""})
+    for dims in get_goal_resources(snap, resource="Dimensions"):
         for dim in dims:
             for code in dim["codes"]:
-                d.append(
-                    {
-                        "id": dim["id"],
-                        "code": code["code"],
-                        "description": code["description"],
-                    }
-                )
-    dim_dict = defaultdict(lambda: {np.nan: ""})
-    for dimen in d:
-        dim_dict[dimen["id"]][dimen["code"]] = dimen["description"]
+                dim_dict[dim["id"]][code["code"]] = code["description"]
 
     return dim_dict
 
 
-def get_goal_codes(snap: Snapshot) -> List[int]:
-    # retrieves all goal codes
+def get_goal_resources(snap: Snapshot, resource: str) -> List[Any]:
+    """Retrieves a resource (e.g. 'Attributes' or 'Dimensions') for each goal, fetching all goals concurrently."""
     assert snap.metadata.source
-    url = f"{snap.metadata.source.source_data_url}/v1/sdg/Goal/List"
+    base_url = snap.metadata.source.source_data_url
+    assert base_url is not None
+    goal_codes = get_goal_codes(base_url)
+    with requests.Session() as session:
+        session.mount("https://", HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS))
+
+        def fetch(goal: int) -> Any:
+            res = session.get(f"{base_url}/v1/sdg/Goal/{goal}/{resource}")
+            assert res.ok
+            return res.json()
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            return list(executor.map(fetch, goal_codes))
+
+
+@lru_cache(maxsize=1)
+def get_goal_codes(source_data_url: str) -> List[int]:
+    # retrieves all goal codes (cached, since both attributes and dimensions need them)
+    url = f"{source_data_url}/v1/sdg/Goal/List"
     res = requests.get(url)
     assert res.ok
     goals = res.json()
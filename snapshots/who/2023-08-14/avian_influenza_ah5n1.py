@@ -1,5 +1,6 @@
 """Script to create a snapshot of dataset."""
 
+import shutil
 from pathlib import Path
 
 import click
@@ -26,7 +27,7 @@ def main(path_to_file: str, upload: bool) -> None:
     snap.path.parent.mkdir(exist_ok=True, parents=True)
 
     # Copy local data file to snapshots data folder.
-    snap.path.write_bytes(Path(path_to_file).read_bytes())
+    shutil.copyfile(path_to_file, snap.path)
 
     # Add file to DVC and upload to S3.
     snap.dvc_add(upload=upload)
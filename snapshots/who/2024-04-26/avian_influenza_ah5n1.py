@@ -3,6 +3,7 @@
 CDC provides this same data but in a machine-readable format, which one can download from https://www.cdc.gov/flu/avianflu/chart-epi-curve-ah5n1.html under "Download data (CSV)".
 """
 
+import shutil
 from pathlib import Path
 
 import click
@@ -24,7 +25,7 @@ def main(upload: bool, path_to_file: str) -> None:
     snap.path.parent.mkdir(exist_ok=True, parents=True)
 
     # Copy local data file to snapshots data folder.
-    snap.path.write_bytes(Path(path_to_file).read_bytes())
+    shutil.copyfile(path_to_file, snap.path)
 
     # Add file to DVC and upload to S3.
     snap.dvc_add(upload=upload)
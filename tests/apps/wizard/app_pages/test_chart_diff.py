@@ -0,0 +1,47 @@
+import datetime as dt
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from apps.wizard.app_pages.chart_diff.chart_diff import ChartDiff
+from etl import grapher_model as gm
+
+
+def _sqlite_engine():
+    engine = create_engine("sqlite://")
+
+    # MySQL function used as default for `updatedAt`
+    @event.listens_for(engine, "connect")
+    def _add_utc_timestamp(dbapi_connection, _):
+        dbapi_connection.create_function(
+            "utc_timestamp", 0, lambda: dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        )
+
+    gm.ChartDiffApprovals.__table__.create(engine)  # type: ignore
+    return engine
+
+
+def test_set_status_batch_after_session_is_closed():
+    engine = _sqlite_engine()
+    chart_diffs = [
+        ChartDiff(
+            source_chart=SimpleNamespace(id=chart_id, updatedAt=dt.datetime(2024, 1, 1)),  # type: ignore
+            target_chart=None,
+            approval=None,
+            conflict=None,
+            edited_in_staging=True,
+        )
+        for chart_id in [1, 2]
+    ]
+
+    with Session(engine) as session:
+        ChartDiff.set_status_batch(session, chart_diffs, gm.ChartStatus.APPROVED.value)
+
+    # Approvals are expired and detached now, but the status should still be readable.
+    for chart_diff in chart_diffs:
+        assert chart_diff.approval_status == gm.ChartStatus.APPROVED.value
+        assert chart_diff.is_reviewed
+
+    with Session(engine) as session:
+        assert session.query(gm.ChartDiffApprovals).count() == 2
@@ -0,0 +1,42 @@
+from importlib import import_module
+
+import numpy as np
+import pandas as pd
+import pytest
+
+un_sdg = import_module("etl.steps.data.garden.un.2023-08-16.un_sdg")
+
+
+@pytest.mark.parametrize("dtype", [object, "category"])
+def test_manual_clean_data_recodes_ihr_capacity(dtype):
+    df = pd.DataFrame(
+        {
+            "value": [50.0, 120.0, 1.0, 2.0],
+            "long_unit": ["Percentage"] * 4,
+            "indicator": ["15.2.1", "15.2.1", "3.d.1", "3.d.1"],
+            "ihr_capacity": pd.Series(["IHR02", "IHR03", "IHR03", np.nan], dtype=dtype),
+        }
+    )
+
+    df = un_sdg.manual_clean_data(df)
+
+    assert df["ihr_capacity"].dtype == "category"
+    assert df["ihr_capacity"].tolist()[:3] == ["SPAR02", "SPAR06", "SPAR06"]
+    assert pd.isna(df["ihr_capacity"].iloc[3])
+    assert df["value"].tolist() == [50.0, 100.0, 1.0, 2.0]
+
+
+def test_manual_clean_data_keeps_codes_that_are_not_recoded():
+    df = pd.DataFrame(
+        {
+            "value": [1.0, 2.0, 3.0],
+            "long_unit": ["Number"] * 3,
+            "indicator": ["3.d.1"] * 3,
+            "ihr_capacity": pd.Series(["IHR02", "SPAR02", "SPAR01"], dtype="category"),
+        }
+    )
+
+    df = un_sdg.manual_clean_data(df)
+
+    assert df["ihr_capacity"].tolist() == ["SPAR02", "SPAR02", "SPAR01"]
+    assert sorted(df["ihr_capacity"].cat.categories) == ["SPAR01", "SPAR02"]